@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Discriminator, Field, Tag, model_validator
 
 from analink.core.status import ContainerStateProvider, ContainerStatus
 
@@ -22,6 +22,8 @@ class ConditionType(Enum):
 class UnaryCondition(BaseModel):
     """Single condition check - pure description of what to check"""
 
+    # Tag of the Condition union, optional in input and left out of dumps
+    kind: Literal["unary"] = Field(default="unary", exclude=True)
     condition_type: ConditionType
     container_reference: Optional[str] = (
         None  # Reference to container for container-based conditions
@@ -139,9 +141,11 @@ class UnaryCondition(BaseModel):
 class BinaryCondition(BaseModel):
     """AND/OR condition with two operands"""
 
-    left: Union["UnaryCondition", "BinaryCondition"]
+    # Tag of the Condition union, optional in input and left out of dumps
+    kind: Literal["binary"] = Field(default="binary", exclude=True)
+    left: "Condition"
     operator: str  # "AND" or "OR"
-    right: Union["UnaryCondition", "BinaryCondition"]
+    right: "Condition"
 
     def evaluate(self, provider: ContainerStateProvider) -> bool:
         """Evaluate this binary condition using the provider"""
@@ -155,5 +159,21 @@ class BinaryCondition(BaseModel):
         return False
 
 
-# Union type for any condition
-Condition = Union[UnaryCondition, BinaryCondition]
+def _condition_tag(value: Any) -> Optional[str]:
+    """Tag of a condition payload: its kind, or else inferred from its shape"""
+    if isinstance(value, dict):
+        return value.get("kind", "binary" if "left" in value else "unary")
+    return getattr(value, "kind", None)
+
+
+# Union type for any condition, pydantic picks the member from its tag
+# instead of trying each member in turn
+Condition = Annotated[
+    Union[
+        Annotated[UnaryCondition, Tag("unary")],
+        Annotated[BinaryCondition, Tag("binary")],
+    ],
+    Discriminator(_condition_tag),
+]
+
+BinaryCondition.model_rebuild()
@@ -5,9 +5,30 @@ from analink.core.condition import Condition, ConditionType, UnaryCondition
 from analink.core.models import Node, NodeType
 from analink.parser.utils import count_leading_chars, extract_knot_name
 
+# Node type and stickiness for the marker starting a choice or a gather line
+CHOICE_OR_GATHER_MARKERS: dict[str, tuple[NodeType, bool]] = {
+    "+": (NodeType.CHOICE, True),
+    "*": (NodeType.CHOICE, False),
+    "-": (NodeType.GATHER, False),
+}
+
+# Node types a following BASE line is merged into
+MERGEABLE_NODE_TYPES = frozenset({NodeType.GATHER, NodeType.CHOICE, NodeType.BASE})
+
+# Compiled once at import, re.match/re.search would look them up per call
+CONDITION_PATTERN = re.compile(r"\{([^}]+)\}")
+SEEN_COUNT_GT_PATTERN = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_.]*)\s*>\s*(\d+)$")
+SEEN_COUNT_LT_PATTERN = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_.]*)\s*<\s*(\d+)$")
+CONTAINER_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_.]*$")
+
 
 def parse_condition_string(condition_str: str) -> Optional[Condition]:
-    """Parse an Ink condition string like 'not visit_paris' into a Condition object"""
+    """Parse an Ink condition string like 'not visit_paris' into a Condition object
+
+    Every field is produced by the patterns below (a container name and a
+    non-negative count), so conditions are built with model_construct and
+    skip the model validator.
+    """
     if not condition_str or not condition_str.strip():
         return None
 
@@ -16,35 +37,35 @@ def parse_condition_string(condition_str: str) -> Optional[Condition]:
     # Handle "not knot_name" - should check if seen count == 0
     if condition_str.startswith("not "):
         knot_name = condition_str[4:].strip()
-        return UnaryCondition(
+        return UnaryCondition.model_construct(
             condition_type=ConditionType.SEEN_COUNT_EQ,
             container_reference=knot_name,
             expected_value=0,
         )
 
     # Handle "knot_name > 3"
-    gt_match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_.]*)\s*>\s*(\d+)$", condition_str)
+    gt_match = SEEN_COUNT_GT_PATTERN.match(condition_str)
     if gt_match:
         knot_name, count = gt_match.groups()
-        return UnaryCondition(
+        return UnaryCondition.model_construct(
             condition_type=ConditionType.SEEN_COUNT_GT,
             container_reference=knot_name,
             expected_value=int(count),
         )
 
     # Handle "knot_name < 3"
-    lt_match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_.]*)\s*<\s*(\d+)$", condition_str)
+    lt_match = SEEN_COUNT_LT_PATTERN.match(condition_str)
     if lt_match:
         knot_name, count = lt_match.groups()
-        return UnaryCondition(
+        return UnaryCondition.model_construct(
             condition_type=ConditionType.SEEN_COUNT_LT,
             container_reference=knot_name,
             expected_value=int(count),
         )
 
     # Handle plain "knot_name" - should check if seen count > 0
-    if re.match(r"^[a-zA-Z_][a-zA-Z0-9_.]*$", condition_str):
-        return UnaryCondition(
+    if CONTAINER_NAME_PATTERN.match(condition_str):
+        return UnaryCondition.model_construct(
             condition_type=ConditionType.SEEN_COUNT_GT,
             container_reference=condition_str,
             expected_value=0,
@@ -55,7 +76,7 @@ def parse_condition_string(condition_str: str) -> Optional[Condition]:
 
 def extract_condition_from_line(line: str) -> tuple[str, Optional[Condition]]:
     """Extract condition from line and return cleaned line + condition"""
-    condition_match = re.search(r"\{([^}]+)\}", line)
+    condition_match = CONDITION_PATTERN.search(line)
     condition = None
 
     if condition_match:
@@ -73,9 +94,14 @@ class InkLineParser:
     def __init__(self):
         self.in_comment = False
 
-    def is_comment_or_empty(self, line: str) -> bool:
+    def reset(self) -> None:
+        """Forget any open block comment, to parse another file"""
+        self.in_comment = False
+
+    def is_comment_or_empty(self, line: str, stripped: Optional[str] = None) -> bool:
         """Check if line is empty or a comment"""
-        stripped = line.strip()
+        if stripped is None:
+            stripped = line.strip()
 
         if not stripped or stripped.startswith("//"):
             return True
@@ -95,12 +121,17 @@ class InkLineParser:
         return False
 
     def parse_divert(
-        self, line: str, last_level: int, line_number: int
+        self,
+        line: str,
+        last_level: int,
+        line_number: int,
+        stripped: Optional[str] = None,
     ) -> Optional[Node]:
         """Parse divert lines (starting with ->)"""
-        stripped = line.strip()
+        if stripped is None:
+            stripped = line.strip()
         if stripped.startswith("->"):
-            divert_name = stripped.split("->")[-1].strip()
+            divert_name = stripped.rpartition("->")[2].strip()
             return Node(
                 level=last_level,
                 node_type=NodeType.DIVERT,
@@ -110,9 +141,12 @@ class InkLineParser:
             )
         return None
 
-    def parse_knot_or_stitches(self, line: str, line_number: int) -> Optional[Node]:
+    def parse_knot_or_stitches(
+        self, line: str, line_number: int, stripped: Optional[str] = None
+    ) -> Optional[Node]:
         """Parse knot (==) or stitches (=) lines"""
-        stripped = line.strip()
+        if stripped is None:
+            stripped = line.strip()
         if stripped.startswith("=="):
             knot_name = extract_knot_name(stripped)
             return Node(
@@ -134,83 +168,76 @@ class InkLineParser:
         return None
 
     def parse_choice_or_gather(
-        self, line: str, line_number: int
+        self, line: str, line_number: int, stripped: Optional[str] = None
     ) -> Optional[tuple[Node, int]]:
         """Parse choice (*) or gather (-) lines"""
-        stripped = line.strip()
+        if stripped is None:
+            stripped = line.strip()
+
+        # Only a marker (or a condition in front of it) can start a choice or
+        # a gather, other lines skip the condition regex
+        first_char = stripped[:1]
+        if first_char != "{" and first_char not in CHOICE_OR_GATHER_MARKERS:
+            return None
 
         # Extract condition first (before counting leading chars)
         stripped, condition = extract_condition_from_line(stripped)
 
-        sticky_choice_count, text_choice = count_leading_chars(stripped, "+")
-        if sticky_choice_count > 0:
-            return (
-                Node(
-                    level=sticky_choice_count,
-                    node_type=NodeType.CHOICE,
-                    content=text_choice,
-                    raw_content=line,
-                    line_number=line_number,
-                    is_sticky=True,
-                    condition=condition,
-                ),
-                sticky_choice_count,
-            )
-        choice_count, text_choice = count_leading_chars(stripped, "*")
-        if choice_count > 0:
-            return (
-                Node(
-                    level=choice_count,
-                    node_type=NodeType.CHOICE,
-                    content=text_choice,
-                    raw_content=line,
-                    line_number=line_number,
-                    condition=condition,
-                ),
-                choice_count,
-            )
-
-        gather_count, text_gather = count_leading_chars(stripped, "-")
-        if gather_count > 0:
-            return (
-                Node(
-                    level=gather_count,
-                    node_type=NodeType.GATHER,
-                    content=text_gather,
-                    raw_content=line,
-                    line_number=line_number,
-                    condition=condition,
-                ),
-                gather_count,
-            )
+        marker = stripped[:1]
+        marker_info = CHOICE_OR_GATHER_MARKERS.get(marker)
+        if marker_info is None:
+            return None
+        node_type, is_sticky = marker_info
 
-        return None
+        level, text = count_leading_chars(stripped, marker)
+        return (
+            Node(
+                level=level,
+                node_type=node_type,
+                content=text,
+                raw_content=line,
+                line_number=line_number,
+                is_sticky=is_sticky,
+                condition=condition,
+            ),
+            level,
+        )
 
     def parse_line(
         self, line: str, line_number: int, last_level: int
     ) -> tuple[Optional[Node], int]:
         """Parse a single line of Ink code"""
+        # Stripped once here and handed to every step below
+        stripped = line.strip()
+
         # Skip empty lines and comments
-        if self.is_comment_or_empty(line):
+        if self.is_comment_or_empty(line, stripped):
             return None, last_level
 
-        # Try parsing as divert
-        divert_node = self.parse_divert(line, last_level, line_number)
-        if divert_node is not None:
-            return divert_node, last_level
+        # Dispatch on the first character so a line only goes through the
+        # parsers that can match it (divert, knot or stitches, choice or gather)
+        first_char = stripped[0]
 
-        # Try parsing as knot or stitches
-        knot_or_stitches_node = self.parse_knot_or_stitches(line, line_number)
-        if knot_or_stitches_node is not None:
-            return knot_or_stitches_node, 0
+        if first_char == "-" and stripped.startswith("->"):
+            divert_node = self.parse_divert(line, last_level, line_number, stripped)
+            if divert_node is not None:
+                return divert_node, last_level
+
+        if first_char == "=":
+            knot_or_stitches_node = self.parse_knot_or_stitches(
+                line, line_number, stripped
+            )
+            if knot_or_stitches_node is not None:
+                return knot_or_stitches_node, 0
 
         # Try parsing as choice or gather
-        choice_or_gather_result = self.parse_choice_or_gather(line, line_number)
+        choice_or_gather_result = self.parse_choice_or_gather(
+            line, line_number, stripped
+        )
         if choice_or_gather_result is not None:
             return choice_or_gather_result
 
         # Default to base content
-        stripped = line.strip()
         return (
             Node(
                 level=last_level,
@@ -229,53 +256,74 @@ class LineMerger:
     def __init__(self, clean_text_sep: str = " "):
         self.clean_text_sep = clean_text_sep
         self.lines: dict[int, Node] = {}
-        self.previous_item_id: Optional[int] = None
+        # Kept by reference: merging grows this node in place
+        self.previous_node: Optional[Node] = None
+
+        # BASE lines waiting to be merged into the previous node, joined once
+        # when the block closes instead of concatenated line by line
+        self.pending_content: list[str] = []
+        self.pending_raw_content: list[str] = []
+        self.pending_condition: Optional[Condition] = None
 
     def can_merge_with_previous(self, node: Node) -> bool:
         """Check if the current node can be merged with the previous one"""
-        if node.node_type != NodeType.BASE or self.previous_item_id is None:
+        if node.node_type is not NodeType.BASE or self.previous_node is None:
             return False
 
-        previous_node = self.lines[self.previous_item_id]
-        return previous_node.node_type in (
-            NodeType.GATHER,
-            NodeType.CHOICE,
-            NodeType.BASE,
-        )
+        return self.previous_node.node_type in MERGEABLE_NODE_TYPES
 
-    def merge_with_previous(self, node: Node) -> Node:
-        """Merge the current node with the previous one"""
-        if self.previous_item_id is None:
-            raise AttributeError("previous item id cannot be None when merging")
-        previous_node = self.lines[self.previous_item_id]
-        if previous_node.content is None or node.content is None:
+    def buffer_for_merge(self, node: Node) -> None:
+        """Queue the current node to be merged with the previous one"""
+        if self.previous_node is None:
+            raise AttributeError("previous node cannot be None when merging")
+        if node.content is None:
             raise AttributeError("nodes content cannot be None when merging")
-        merged_node = Node(
-            level=previous_node.level,
-            node_type=previous_node.node_type,
-            content=previous_node.content + self.clean_text_sep + node.content,
-            raw_content=previous_node.raw_content + "\n" + node.raw_content,
-            line_number=previous_node.line_number,
-            condition=(
-                previous_node.condition if previous_node.condition else node.condition
-            ),
+        self.pending_content.append(node.content)
+        self.pending_raw_content.append(node.raw_content)
+        if self.pending_condition is None:
+            self.pending_condition = node.condition
+
+    def flush_pending(self) -> Optional[Node]:
+        """Merge the buffered nodes into the previous one and return the result"""
+        previous_node = self.previous_node
+        if not self.pending_content or previous_node is None:
+            return None
+        if previous_node.content is None:
+            raise AttributeError("nodes content cannot be None when merging")
+        # Grow the previous node in place: it keeps its id and its position
+        previous_node.content = self.clean_text_sep.join(
+            [previous_node.content, *self.pending_content]
         )
+        previous_node.raw_content = "\n".join(
+            [previous_node.raw_content, *self.pending_raw_content]
+        )
+        if not previous_node.condition:
+            previous_node.condition = self.pending_condition
+
+        self.pending_content = []
+        self.pending_raw_content = []
+        self.pending_condition = None
 
-        # Remove the previous node and update tracking
-        del self.lines[self.previous_item_id]
-        self.lines[merged_node.item_id] = merged_node
-        self.previous_item_id = merged_node.item_id
+        return previous_node
 
+    def merge_with_previous(self, node: Node) -> Node:
+        """Merge the current node with the previous one"""
+        self.buffer_for_merge(node)
+        merged_node = self.flush_pending()
+        if merged_node is None:
+            raise AttributeError("previous node cannot be None when merging")
         return merged_node
 
     def add_node(self, node: Node) -> None:
         """Add a node, merging with previous if applicable"""
-        if node.node_type == NodeType.BASE and self.can_merge_with_previous(node):
-            self.merge_with_previous(node)
+        if self.can_merge_with_previous(node):
+            self.buffer_for_merge(node)
         else:
+            self.flush_pending()
             self.lines[node.item_id] = node
-            self.previous_item_id = node.item_id
+            self.previous_node = node
 
     def get_lines(self) -> dict[int, Node]:
         """Get the final merged lines"""
+        self.flush_pending()
         return self.lines
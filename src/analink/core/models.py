@@ -1,9 +1,9 @@
 # analink.core.models
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, Optional
-
-from pydantic import BaseModel, PrivateAttr, computed_field
+from itertools import count
+from typing import ClassVar, Iterator, Optional
 
 from analink.core.condition import Condition
 from analink.parser.utils import extract_parts
@@ -21,9 +21,10 @@ class NodeType(Enum):
     AUTO_END = "auto_end"
 
 
-class Node(BaseModel):
-    # Instance fields
-    _id: int = PrivateAttr(default_factory=lambda: Node._get_next_id())
+@dataclass(slots=True)
+class Node:
+    # Plain slotted dataclass (as are RawKnot and RawStory): these are only
+    # built by the parser, so they do not need pydantic validation
     node_type: NodeType
     raw_content: str
     level: int
@@ -40,51 +41,33 @@ class Node(BaseModel):
     stitch_name: str = "HEADER"
     is_sticky: bool = False
     condition: Optional[Condition] = None
+    # Drawn from the class counter at construction, only the END, BEGIN and
+    # AUTO_END nodes override it with their fixed negative id
+    item_id: int = field(init=False, default_factory=lambda: next(Node._id_counter))
 
-    _next_id: ClassVar[int] = 1
+    _id_counter: ClassVar[Iterator[int]] = count(1)
 
     @classmethod
     def end_node(cls):
-        return cls(
-            node_type=NodeType.END, raw_content="", level=-1, line_number=-1, name="END"
-        )
+        return _sentinel_node(NodeType.END, -1)
 
     @classmethod
     def auto_end_node(cls):
-        return cls(
-            node_type=NodeType.AUTO_END,
-            raw_content="",
-            level=-1,
-            line_number=-1,
-            name="AUTO_END",
-        )
+        return _sentinel_node(NodeType.AUTO_END, -3)
 
     @classmethod
     def begin_node(cls):
-        return cls(
-            node_type=NodeType.BEGIN,
-            raw_content="",
-            level=-1,
-            line_number=-1,
-            name="BEGIN",
-        )
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def item_id(self) -> int:
-        return self._id
+        return _sentinel_node(NodeType.BEGIN, -2)
 
     @classmethod
     def _get_next_id(cls) -> int:
         """Get the next available ID and increment the counter"""
-        current_id = cls._next_id
-        cls._next_id += 1
-        return current_id
+        return next(cls._id_counter)
 
     @classmethod
-    def reset_id_counter(cls) -> None:
+    def reset_id_counter(cls, start: int = 1) -> None:
         """Reset the ID counter (useful for testing)"""
-        cls._next_id = 1
+        cls._id_counter = count(start)
 
     def parse_choice(self):
         choice_content, display_content = extract_parts(self.content)
@@ -93,22 +76,21 @@ class Node(BaseModel):
         return self
 
     def parse_divert(self) -> Optional["Node"]:
-        if self.content is not None:
-            if self.content.strip().startswith("->"):
-                self.is_fallback = True
-                self.content = self.content.replace("->", "")
-                return None
-            if "->" in self.content:
-                new_content, divert_target = self.content.split("->")
-                self.content = new_content.strip()
-                return Node(
-                    node_type=NodeType.DIVERT,
-                    raw_content=f"-> {divert_target.strip()}",
-                    level=self.level,
-                    line_number=self.line_number,
-                    name=divert_target.strip(),
-                )
-        return None
+        if self.content is None or "->" not in self.content:
+            return None
+        if self.content.strip().startswith("->"):
+            self.is_fallback = True
+            self.content = self.content.replace("->", "")
+            return None
+        new_content, _, divert_target = self.content.partition("->")
+        self.content = new_content.strip()
+        return Node(
+            node_type=NodeType.DIVERT,
+            raw_content=f"-> {divert_target.strip()}",
+            level=self.level,
+            line_number=self.line_number,
+            name=divert_target.strip(),
+        )
 
     def parse_glue(self):
         if self.content is None:
@@ -150,17 +132,50 @@ class Node(BaseModel):
         return new_node
 
 
-class RawKnot(BaseModel):
+def _sentinel_node(node_type: NodeType, item_id: int) -> Node:
+    """Build an END/BEGIN/AUTO_END node, identified by its fixed id"""
+    node = Node(
+        node_type=node_type,
+        raw_content="",
+        level=-1,
+        line_number=-1,
+        name=node_type.name,
+    )
+    node.item_id = item_id
+    return node
+
+
+@dataclass(slots=True)
+class RawKnot:
     header: dict[int, Node]
     stitches: dict[int, dict[int, Node]]
     stitches_info: dict[int, Node]
+    # Every node by id, built once: the parser never edits a knot afterwards
+    _node_index: dict[int, Node] = field(init=False, repr=False, compare=False)
+    _block_name_to_id: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Filled in reverse lookup order so header wins over stitches_info,
+        # which wins over the stitches, as in the former linear scan
+        self._node_index = {}
+        for stitches in reversed(self.stitches.values()):
+            self._node_index.update(stitches)
+        self._node_index.update(self.stitches_info)
+        self._node_index.update(self.header)
 
     @property
     def block_name_to_id(self):
-        ret = {}
-        for item_id, node in self.stitches_info.items():
-            ret[node.name] = list(self.stitches[item_id].values())[0].item_id
-        return ret
+        if self._block_name_to_id is None:
+            ret = {}
+            for item_id, node in self.stitches_info.items():
+                first_node = next(iter(self.stitches[item_id].values()), None)
+                if first_node is None:
+                    raise IndexError(f"stitch {node.name} has no content")
+                ret[node.name] = first_node.item_id
+            self._block_name_to_id = ret
+        return self._block_name_to_id
 
     def get_blocks(self) -> list[dict[int, Node]]:
         ret = []
@@ -172,44 +187,48 @@ class RawKnot(BaseModel):
     @property
     def first_id(self):
         if len(self.header) > 0:
-            return list(self.header.values())[0].item_id
-        else:
-            return list(list(self.stitches.values())[0].values())[0].item_id
+            return next(iter(self.header.values())).item_id
+        first_stitch = next(iter(self.stitches.values()), {})
+        first_node = next(iter(first_stitch.values()), None)
+        if first_node is None:
+            raise IndexError("knot has no header and its first stitch is empty")
+        return first_node.item_id
 
     def get_node(self, item_id) -> Optional[Node]:
-        if item_id in self.header:
-            return self.header[item_id]
-        if item_id in self.stitches_info:
-            return self.stitches_info[item_id]
-        for stitches in self.stitches.values():
-            if item_id in stitches:
-                return stitches[item_id]
-        return None
+        return self._node_index.get(item_id)
 
 
-class RawStory(BaseModel):
+@dataclass(slots=True)
+class RawStory:
     header: dict[int, Node]
     knots: dict[int, RawKnot]
     knots_info: dict[int, Node]
+    # Every node of the story by id, merged from the knots' own indexes
+    _node_index: dict[int, Node] = field(init=False, repr=False, compare=False)
+    _block_name_to_id: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._node_index = {}
+        for knot in reversed(self.knots.values()):
+            self._node_index.update(knot._node_index)
+        self._node_index.update(self.knots_info)
+        self._node_index.update(self.header)
 
     @property
     def block_name_to_id(self):
-        ret = {}
-        for item_id, node in self.knots_info.items():
-            # knot_name => first of header if len(header)>0 else first_
-            ret[node.name] = self.knots[item_id].first_id
-            pre_knot_block = self.knots[item_id].block_name_to_id
-            for stitiches_name, stitches_link_id in pre_knot_block.items():
-                ret[f"{node.name}.{stitiches_name}"] = stitches_link_id
-        return ret
+        # Computed on first use only, the story is not edited after parsing
+        if self._block_name_to_id is None:
+            ret = {}
+            for item_id, node in self.knots_info.items():
+                # knot_name => first of header if len(header)>0 else first_
+                ret[node.name] = self.knots[item_id].first_id
+                pre_knot_block = self.knots[item_id].block_name_to_id
+                for stitiches_name, stitches_link_id in pre_knot_block.items():
+                    ret[f"{node.name}.{stitiches_name}"] = stitches_link_id
+            self._block_name_to_id = ret
+        return self._block_name_to_id
 
     def get_node(self, item_id) -> Optional[Node]:
-        if item_id in self.header:
-            return self.header[item_id]
-        if item_id in self.knots_info:
-            return self.knots_info[item_id]
-        for knot in self.knots.values():
-            possible_node = knot.get_node(item_id)
-            if possible_node is not None:
-                return possible_node
-        return None
+        return self._node_index.get(item_id)
@@ -1,5 +1,7 @@
 # analink.parser.node
 
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +9,19 @@ from analink.core.line_parser import InkLineParser, LineMerger
 from analink.core.models import Node, NodeType, RawKnot, RawStory
 
 
+@lru_cache(maxsize=64)
+def _read_include_lines(file_path: Path, mtime_ns: int) -> tuple[str, ...]:
+    """Lines of an included file, cached until the file is modified"""
+    with open(file_path, "r") as f:
+        return tuple(f.read().strip().split("\n"))
+
+
+def read_include_lines(file_path: Path) -> tuple[str, ...]:
+    """Read the lines of an included file, reusing them while it is unchanged"""
+    file_path = file_path.resolve()
+    return _read_include_lines(file_path, file_path.stat().st_mtime_ns)
+
+
 class RawStoryBuilder:
     """Handles building the hierarchical story structure from parsed nodes"""
 
@@ -63,35 +78,32 @@ class RawStoryBuilder:
         """Add a content node to the appropriate section"""
         node.knot_name = self.current_knot_name
         node.stitch_name = self.current_stitch_name
+
+        # Pick the section once, the node and its divert both go there
         if self.current_knot_id is None:
             # Add to story header
-            self.header[node.item_id] = node
-            if divert_node is not None:
-                self.header[divert_node.item_id] = divert_node
+            target = self.header
+        elif self.current_stitches_id is not None:
+            # Add to current stitches
+            target = self.current_stitches[self.current_stitches_id]
         else:
-            # Add to current knot
-            if self.current_stitches_id is not None:
-                # Add to current stitches
-                self.current_stitches[self.current_stitches_id][node.item_id] = node
-                if divert_node is not None:
-                    self.current_stitches[self.current_stitches_id][
-                        divert_node.item_id
-                    ] = divert_node
-            else:
-                # Add to knot header
-                if self.current_knot_header is None:
-                    self.current_knot_header = {}
-                self.current_knot_header[node.item_id] = node
-                if divert_node is not None:
-                    self.current_knot_header[divert_node.item_id] = divert_node
+            # Add to knot header
+            if self.current_knot_header is None:
+                self.current_knot_header = {}
+            target = self.current_knot_header
+
+        target[node.item_id] = node
+        if divert_node is not None:
+            target[divert_node.item_id] = divert_node
 
     def process_node(self, node: Node) -> None:
         """Process a single node and add it to the appropriate section"""
-        if node.node_type == NodeType.KNOT:
+        node_type = node.node_type
+        if node_type is NodeType.KNOT:
             self.start_new_knot(node)
             node.knot_name = node.name or "HEADER"  # Set its own knot name
             node.stitch_name = "HEADER"
-        elif node.node_type == NodeType.STITCHES:
+        elif node_type is NodeType.STITCHES:
             node.knot_name = self.current_knot_name  # Inherit current knot
             node.stitch_name = node.name or "HEADER"  # Set its own stitch name
             self.start_new_stitches(node)
@@ -122,17 +134,23 @@ class InkParser:
     def handle_include_files(
         self, raw_lines: list[str], cwd: Optional[Path] = None
     ) -> list[str]:
-        """Process INCLUDE directives and return expanded lines"""
-        for line in raw_lines:
-            if line.strip().startswith("INCLUDE"):
+        """Process INCLUDE directives and return expanded lines
+
+        Included files are appended after the lines already queued, and their
+        own INCLUDE directives are expanded the same way.
+        """
+        expanded_lines: list[str] = []
+        pending = deque(raw_lines)
+        while pending:
+            line = pending.popleft()
+            # Substring test first, most lines are never stripped here
+            if "INCLUDE" in line and line.strip().startswith("INCLUDE"):
                 file_name = line.split("INCLUDE")[-1].strip()
                 file_path = (cwd if cwd else Path.cwd()) / file_name
-
-                with open(file_path, "r") as f:
-                    included_content = f.read()
-                raw_lines.remove(line)
-                raw_lines.extend(included_content.strip().split("\n"))
-        return raw_lines
+                pending.extend(read_include_lines(file_path))
+            else:
+                expanded_lines.append(line)
+        return expanded_lines
 
     def parse(self, ink_code: str, cwd: Optional[Path] = None) -> RawStory:
         """Parse Ink code and return a RawStory structure"""
@@ -143,12 +161,14 @@ class InkParser:
         raw_lines = ink_code.strip().split("\n")
         expanded_lines = self.handle_include_files(raw_lines, cwd)
 
-        # Parse each line
+        # Parse each line, with the per-line methods bound once
+        parse_line = parser.parse_line
+        add_node = line_merger.add_node
         last_level = 0
-        for i, line in enumerate(expanded_lines):
-            parsed_line, last_level = parser.parse_line(line, i + 1, last_level)
+        for line_number, line in enumerate(expanded_lines, start=1):
+            parsed_line, last_level = parse_line(line, line_number, last_level)
             if parsed_line is not None:
-                line_merger.add_node(parsed_line)
+                add_node(parsed_line)
 
         # Build the final story structure
         lines = line_merger.get_lines()
@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel
-
 
 class ContainerStatus(Enum):
     """Possible statuses a container can have"""
@@ -17,7 +16,8 @@ class ContainerStatus(Enum):
     # Add more statuses as needed
 
 
-class ContainerState(BaseModel):
+@dataclass(slots=True)
+class ContainerState:
     """Tracks the state of a specific container"""
 
     status: ContainerStatus = ContainerStatus.NOT_CLICKED
@@ -29,6 +29,9 @@ class ContainerState(BaseModel):
 class ContainerStateProvider(ABC):
     """Interface for providing container states to conditions"""
 
+    # No instance dict of its own, so slotted providers stay dict-free
+    __slots__ = ()
+
     @abstractmethod
     def get_container_state(
         self, container_reference: Optional[str]
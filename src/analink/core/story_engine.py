@@ -2,17 +2,91 @@
 Core story engine for managing interactive fiction state and flow.
 """
 
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, List, Optional
 
 import networkx as nx
 
 from analink.core.condition import Condition
+from analink.core.models import RawKnot, RawStory
 from analink.core.parser import Node, NodeType, clean_lines
 from analink.core.status import ContainerState, ContainerStateProvider, ContainerStatus
 from analink.parser.graph_story import graph_to_mermaid, parse_story
 
 
+@lru_cache(maxsize=32)
+def _parse_story_cached(
+    story_text: str,
+) -> tuple[RawStory, dict[int, Node], tuple[tuple[int, int], ...], int]:
+    """Parse a story without includes from a fresh id counter, and remember it"""
+    Node.reset_id_counter()
+    raw_story = clean_lines(story_text)
+    nodes, edges = parse_story(raw_story)
+    return raw_story, nodes, tuple(edges), Node._get_next_id()
+
+
+def _copy_raw_story(raw_story: RawStory, copies: dict[int, Node]) -> RawStory:
+    """Copy a cached story onto the caller's own nodes.
+
+    ``copies`` maps the ``id()`` of a cached node to its copy, so a node found
+    both in the story and in the node dict stays a single object.
+    """
+
+    def own(nodes: dict[int, Node]) -> dict[int, Node]:
+        ret = {}
+        for item_id, node in nodes.items():
+            node_copy = copies.get(id(node))
+            if node_copy is None:
+                node_copy = copies[id(node)] = copy(node)
+            ret[item_id] = node_copy
+        return ret
+
+    knots = {
+        knot_id: RawKnot(
+            header=own(knot.header),
+            stitches={
+                stitch_id: own(stitch) for stitch_id, stitch in knot.stitches.items()
+            },
+            stitches_info=own(knot.stitches_info),
+        )
+        for knot_id, knot in raw_story.knots.items()
+    }
+    return RawStory(
+        header=own(raw_story.header), knots=knots, knots_info=own(raw_story.knots_info)
+    )
+
+
+def load_story(
+    story_text: str, cwd: Optional[Path] = None
+) -> tuple[RawStory, dict[int, Node], list[tuple[int, int]]]:
+    """
+    Parse a story, reusing the result of a previous parse of the same text.
+
+    The engine mutates the nodes (``choice_order``) and the edges, so every
+    call gets its own shallow copies, and a story rebuilt on them. The id
+    counter is left where a fresh parse would have left it.
+
+    Stories with INCLUDE directives are parsed every time: the included files
+    and the directory they are read from can change between calls.
+    """
+    if "INCLUDE" in story_text:
+        Node.reset_id_counter()
+        raw_story = clean_lines(story_text, cwd=cwd)
+        nodes, edges = parse_story(raw_story)
+        return raw_story, nodes, edges
+
+    raw_story, nodes, edges, next_id = _parse_story_cached(story_text)
+    Node.reset_id_counter(next_id)
+    copies = {id(node): copy(node) for node in nodes.values()}
+    return (
+        _copy_raw_story(raw_story, copies),
+        {node_id: copies[id(node)] for node_id, node in nodes.items()},
+        list(edges),
+    )
+
+
 class StoryEngine(ContainerStateProvider):
     """
     Core engine for managing interactive fiction story state, flow, and logic.
@@ -39,13 +113,11 @@ class StoryEngine(ContainerStateProvider):
             story_text: The ink story content as a string
             typing_speed: Delay between characters for typing effect (0 = instant)
         """
-        Node.reset_id_counter()
         self.typing_speed = typing_speed
         self.let_people_choose_one_choice = let_people_choose_one_choice
 
         # Parse the story
-        self.raw_story = clean_lines(story_text, cwd=cwd)
-        self.nodes, self.edges = parse_story(self.raw_story)
+        self.raw_story, self.nodes, self.edges = load_story(story_text, cwd=cwd)
 
         # Story state
         self.story_history: List[str] = []
@@ -294,12 +366,12 @@ class StoryEngine(ContainerStateProvider):
             if next_node:
                 self.current_node_id = next_node_id
                 # Add content from gather nodes and base content to history
-                if next_node.node_type == NodeType.GATHER and next_node.content:
+                if next_node.node_type is NodeType.GATHER and next_node.content:
                     self._add_content(next_node.content)
-                elif next_node.node_type == NodeType.BASE and next_node.content:
+                elif next_node.node_type is NodeType.BASE and next_node.content:
                     self._add_content(next_node.content)
                 elif (
-                    next_node.node_type == NodeType.CHOICE
+                    next_node.node_type is NodeType.CHOICE
                     and next_node.content
                     and not self.let_people_choose_one_choice
                 ):
@@ -327,7 +399,7 @@ class StoryEngine(ContainerStateProvider):
         for node_id in node_ids:
             if (
                 node_id in self.nodes
-                and self.nodes[node_id].node_type == NodeType.CHOICE
+                and self.nodes[node_id].node_type is NodeType.CHOICE
             ):
                 node = self.nodes[node_id]
                 if node.is_sticky or node_id not in self.node_visited:
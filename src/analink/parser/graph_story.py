@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 import networkx as nx
@@ -6,6 +7,12 @@ from analink.core.parser import Node, NodeType, RawKnot, RawStory
 
 KEY_KNOT_NAME = {"END": -1, "BEGIN": -2, "AUTO_END": -3}
 
+# Same rewrites as the chained str.replace calls they stand for, in one pass
+MERMAID_EDGE_TABLE = str.maketrans(
+    {'"': "&quot;", "'": "&#39;", "\n": " ", "|": "&#124;"}
+)
+MERMAID_NODE_TABLE = str.maketrans({'"': "'", "\n": " "})
+
 
 def find_leaves_from_node(
     start_node_id: int, edges: list[tuple[int, int]]
@@ -37,101 +44,57 @@ def parse_base_block(
     """
     edges = []
     node_at_level: dict[int, list[int]] = {}
+    # last node seen at each level, kept in sync with node_at_level[level][-1]
+    # (a level without nodes has no entry)
+    last_at_level: dict[int, int] = {}
     max_level_seen = 0
+    # one lookup for divert targets, local names shadow global ones
+    name_to_id = {**KEY_KNOT_NAME, **global_block_name_to_id, **local_block_name_to_id}
 
     for item_id, node in nodes.items():
-        max_level_seen = max(node.level, max_level_seen)
-        if node.level not in node_at_level:
-            node_at_level[node.level] = []
-
-        if node.node_type is NodeType.BASE:
-            # strange since it should have been merged
-            node_at_level[node.level].append(item_id)
-            if (
-                node.level > 0
-                and node.level - 1 in node_at_level
-                and len(node_at_level[node.level - 1]) > 0
-            ):
-                edges.append((node_at_level[node.level - 1][-1], item_id))
-
-        elif node.node_type is NodeType.CHOICE:
-            node_at_level[node.level].append(item_id)
-            if (
-                node.level > 0
-                and node.level - 1 in node_at_level
-                and len(node_at_level[node.level - 1]) > 0
-            ):
-                edges.append((node_at_level[node.level - 1][-1], item_id))
-
-        elif node.node_type is NodeType.GATHER:
+        node_type = node.node_type
+        level = node.level
+        max_level_seen = max(level, max_level_seen)
+        if level not in node_at_level:
+            node_at_level[level] = []
+
+        if node_type is NodeType.BASE or node_type is NodeType.CHOICE:
+            # BASE here is strange since it should have been merged
+            node_at_level[level].append(item_id)
+            if level > 0:
+                parent_id = last_at_level.get(level - 1)
+                if parent_id is not None:
+                    edges.append((parent_id, item_id))
+            last_at_level[level] = item_id
+
+        elif node_type is NodeType.GATHER:
             # for every leaves of node in node_at_level[node.level] -> add the edge node.item_id->item_id
-            if node.level in node_at_level:
-                for level_node_item_id in node_at_level[node.level]:
-                    # Find all leaves (descendants with no outgoing edges) from this node
-                    leaves = find_leaves_from_node(level_node_item_id, edges)
-                    for leaf_id in leaves:
-                        edges.append((leaf_id, item_id))
-
-            node_at_level[node.level] = []
-            if node.level - 1 not in node_at_level:
-                node_at_level[node.level - 1] = [item_id]
-            else:
-                node_at_level[node.level - 1][-1] = item_id
-        elif node.node_type is NodeType.DIVERT:
-            # this is the children of the previous node which should be in node_at_level[node.level][-1]
-            if node.level in node_at_level and len(node_at_level[node.level]) > 0:
-                if node.name in local_block_name_to_id:
-                    edges.append(
-                        (
-                            node_at_level[node.level][-1],
-                            local_block_name_to_id[node.name],
-                        )
-                    )
-                elif node.name in global_block_name_to_id:
-                    edges.append(
-                        (
-                            node_at_level[node.level][-1],
-                            global_block_name_to_id[node.name],
-                        )
-                    )
-                elif node.name in KEY_KNOT_NAME:
-                    edges.append(
-                        (
-                            node_at_level[node.level][-1],
-                            KEY_KNOT_NAME[node.name],
-                        )
-                    )
-                else:
-                    raise NotImplementedError("IMPLEMENT THE PARSING ERROR")
+            for level_node_item_id in node_at_level[level]:
+                # Find all leaves (descendants with no outgoing edges) from this node
+                leaves = find_leaves_from_node(level_node_item_id, edges)
+                for leaf_id in leaves:
+                    edges.append((leaf_id, item_id))
+
+            node_at_level[level] = []
+            last_at_level.pop(level, None)
+            if level - 1 not in node_at_level:
+                node_at_level[level - 1] = [item_id]
             else:
-                # high chance we are at the start
-                if node.level == 0:
-                    if node.name in local_block_name_to_id:
-                        edges.append(
-                            (
-                                -2,
-                                local_block_name_to_id[node.name],
-                            )
-                        )
-                    elif node.name in global_block_name_to_id:
-                        edges.append(
-                            (
-                                -2,
-                                global_block_name_to_id[node.name],
-                            )
-                        )
-                    elif node.name in KEY_KNOT_NAME:
-                        edges.append(
-                            (
-                                -2,
-                                KEY_KNOT_NAME[node.name],
-                            )
-                        )
-                    else:
-                        raise NotImplementedError("IMPLEMENT THE PARSING ERROR")
-                else:
+                node_at_level[level - 1][-1] = item_id
+            last_at_level[level - 1] = item_id
+        elif node_type is NodeType.DIVERT:
+            # this is the children of the previous node at the same level
+            parent_id = last_at_level.get(level)
+            if parent_id is None:
+                if level != 0:
                     # raise ParsingError("the divert has no available parent")
                     raise NotImplementedError("IMPLEMENT THE PARSING ERROR SECOND?")
+                # high chance we are at the start
+                parent_id = -2
+            target_id = name_to_id.get(node.name) if node.name is not None else None
+            if target_id is None:
+                raise NotImplementedError("IMPLEMENT THE PARSING ERROR")
+            edges.append((parent_id, target_id))
     return edges
 
 
@@ -165,18 +128,22 @@ def parse_story(raw_story: RawStory):
     return final_nodes, final_edges
 
 
+@lru_cache(maxsize=1024)
 def escape_mermaid_text(text: Optional[str]) -> str:
     """Escape text for use in Mermaid diagrams"""
     if not text:
         return ""
 
-    # Replace quotes with escaped versions or alternatives
-    text = text.replace('"', "&quot;")  # HTML entity for double quotes
-    text = text.replace("'", "&#39;")  # HTML entity for single quotes
-    text = text.replace("\n", " ")  # Replace newlines with spaces
-    text = text.replace("|", "&#124;")  # Escape pipe characters (special in Mermaid)
+    # Quotes and pipes become HTML entities, newlines become spaces
+    return text.translate(MERMAID_EDGE_TABLE)
+
 
-    return text
+@lru_cache(maxsize=1024)
+def mermaid_node_label(content: str) -> str:
+    """Label of a node box: quotes made single, newlines flattened"""
+    # if len(content) > 50:
+    #     content = content[:47] + "..."
+    return content.translate(MERMAID_NODE_TABLE) or "DEFAULT"
 
 
 def excel_column_number_to_name(column_number: int):
@@ -213,11 +180,7 @@ def graph_to_mermaid(
     for node_id, node in nodes.items():
         if node.content is None:
             continue
-        content = node.content.replace('"', "'").replace("\n", " ")
-        # if len(content) > 50:
-        #     content = content[:47] + "..."
-        if len(content) == 0:
-            content = "DEFAULT"
+        content = mermaid_node_label(node.content)
         if node.node_type is NodeType.CHOICE:
             lines.append(f'    {transform_id(node_id)}{{"{content}"}}')
         else:
@@ -1,50 +1,59 @@
 import re
 
+# Compiled once at import, re.match/re.findall would look them up per call
+KNOT_NAME_PATTERN = re.compile(r"^=+\s*(.+?)\s*=*$")
+# Use re.DOTALL flag to make . match newlines too
+CHOICE_PARTS_PATTERN = re.compile(r"(.*)(?<!\\)\[([^\]]*)\](.*)", re.DOTALL)
+BRACKET_PATTERN = re.compile(r"(?<!\\)\[([^\]]*)\]", re.DOTALL)
+
 
 def count_leading_chars(line: str, char: str) -> tuple[int, str]:
     """Count leading characters (for nesting level) and return the text without the leading char"""
-    count = 0
-    idx = 0
-    for c in line:
-        if c == char:
-            count += 1
-            idx += 1
-        elif c == " " or c == "\t":
-            idx += 1
-            continue
-        else:
-            break
-    return count, line[idx:]
+    # lstrip and count both run in C, no need to walk the prefix in Python
+    text = line.lstrip(char + " \t")
+    return line[: len(line) - len(text)].count(char), text
 
 
 def extract_knot_name(text):
     """Extract knot name between = markers"""
     # Match leading =, capture the middle part, ignore trailing =
-    match = re.match(r"^=+\s*(.+?)\s*=*$", text.strip())
+    match = KNOT_NAME_PATTERN.match(text.strip())
     if match:
         return match.group(1).strip()
     return text.strip()
 
 
 def extract_parts(text):
-    # Use re.DOTALL flag to make . match newlines too
-    pattern = r"(.*)(?<!\\)\[([^\]]*)\](.*)"
-    bracket_pattern = r"(?<!\\)\[[^\]]*\]"
-    matches = re.findall(bracket_pattern, text, re.DOTALL)
-    if len(matches) > 1:
-        raise ValueError(f"Multiple bracket patterns found: {len(matches)} occurrences")
-    match = re.match(pattern, text, re.DOTALL)
+    if "[" not in text:
+        # No brackets at all, neither pattern can match
+        return text, text
+    # One scan finds the bracket pair and stops at a second one, only the
+    # error needs the total
+    brackets = BRACKET_PATTERN.finditer(text)
+    bracket = next(brackets, None)
+    if bracket is None:
+        # No brackets found, return original text twice
+        return text, text
+    if next(brackets, None) is not None:
+        occurrences = len(BRACKET_PATTERN.findall(text))
+        raise ValueError(f"Multiple bracket patterns found: {occurrences} occurrences")
+
+    inside = bracket.group(1)
+    if "[" in inside:
+        # A "[" inside the pair: the split happens at the last unescaped one
+        match = CHOICE_PARTS_PATTERN.match(text)
+        if match:
+            before, inside, after = match.groups()
+            return before + inside, before + after
+        return text, text
 
-    if match:
-        before, inside, after = match.groups()
+    before = text[: bracket.start()]
+    after = text[bracket.end() :]
 
-        # Version 1: before + inside
-        version1 = before + inside
+    # Version 1: before + inside
+    version1 = before + inside
 
-        # Version 2: before + after
-        version2 = before + after
+    # Version 2: before + after
+    version2 = before + after
 
-        return version1, version2
-    else:
-        # No brackets found, return original text twice
-        return text, text
+    return version1, version2
@@ -3,10 +3,13 @@ Textual-based user interface for interactive fiction stories.
 Logic separated from styling.
 """
 
-from typing import List
+from collections import deque
+from typing import Deque, List, Optional
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, VerticalScroll
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Button, Static
 
 from analink.core.parser import Node
@@ -15,6 +18,14 @@ from analink.ui.styles import (  # , CYBERPUNK_CSS, VINTAGE_TERMINAL_CSS, FANTAS
     APP_CSS,
 )
 
+# Markup for the messages the engine adds when a story ends
+FORMATTED_END_MESSAGES = {
+    "END OF STORY": "[bold red]END OF STORY[/bold red]",
+    "AUTO END OF STORY generated by the software": (
+        "[bold blue]AUTO END OF STORY generated by the software[/bold blue]"
+    ),
+}
+
 
 class ChoiceButton(Button):
     """A button representing a story choice."""
@@ -55,9 +66,15 @@ class InkStoryApp(App):
         # Text streaming state
         self.is_typing = False
         self.displayed_story_text = ""
-        self.pending_new_content: List[tuple[str, str]] = []
+        self.pending_new_content: Deque[tuple[str, str]] = deque()
         self.current_typing_content = ""
         self.current_typing_position = 0
+        # Open minus close brackets in the typed part of the current content
+        self._bracket_depth = 0
+        # Already displayed text plus separator, shown before the typed part
+        self._display_prefix = ""
+        # Repeating timer driving the typing, running only while typing
+        self._typing_timer: Optional[Timer] = None
         self._next_content_glued = False
         self.block_separator = "\n\n"
 
@@ -97,7 +114,8 @@ class InkStoryApp(App):
         """Callback when new content is added to the story."""
         block_separator = "\n\n"
         # Get the current node to check for glue properties
-        current_node = self.story_engine.nodes.get(self.story_engine.current_node_id)
+        engine = self.story_engine
+        current_node = engine.nodes.get(engine.current_node_id)
 
         # Check for glue_before - affects separator before this content
         if current_node and current_node.glue_before:
@@ -132,16 +150,15 @@ class InkStoryApp(App):
 
     def _format_content(self, content: str) -> str:
         """Format content with Rich markup."""
+        # End-of-story markers are fixed strings, already formatted
+        formatted = FORMATTED_END_MESSAGES.get(content)
+        if formatted is not None:
+            return formatted
         if content.startswith("• "):
             # Format choice text
             return f"[bold cyan]{content}[/bold cyan]"
-        elif content == "END OF STORY":
-            return f"[bold red]{content}[/bold red]"
-        elif content == "AUTO END OF STORY generated by the software":
-            return f"[bold blue]{content}[/bold blue]"
-        else:
-            # Regular story text
-            return f"[white]{content}[/white]"
+        # Regular story text
+        return f"[white]{content}[/white]"
 
     def _start_typing_new_content(self):
         """Start typing only the new content."""
@@ -151,21 +168,32 @@ class InkStoryApp(App):
             self._update_choices(choices)
             return
 
+        if self.story_engine.typing_speed == 0:
+            # Nothing to animate, show every pending block at once
+            self._show_all_pending_content()
+            return
+
         self.is_typing = True
         self.block_separator, self.current_typing_content = self.pending_new_content[0]
         self.current_typing_position = 0
+        self._bracket_depth = 0
+        # Joined once per block, each tick only appends the typed part
+        self._display_prefix = (
+            self.displayed_story_text + self.block_separator
+            if self.displayed_story_text
+            else ""
+        )
         self._type_next_character()
 
     def _type_next_character(self):
         """Type the next character of the new content."""
-        if self.current_typing_position >= len(self.current_typing_content):
+        # Read once per tick, this runs for every typed character
+        content = self.current_typing_content
+        content_length = len(content)
+        if self.current_typing_position >= content_length:
             # Finished typing this piece of content
-            self.displayed_story_text += (
-                self.block_separator + self.current_typing_content
-                if self.displayed_story_text
-                else self.current_typing_content
-            )
-            self.pending_new_content.pop(0)
+            self.displayed_story_text = self._display_prefix + content
+            self.pending_new_content.popleft()
 
             if self.pending_new_content:
                 # More content to type
@@ -173,85 +201,110 @@ class InkStoryApp(App):
             else:
                 # All content typed
                 self.is_typing = False
+                self._stop_typing_timer()
                 choices = self.story_engine.get_available_choices()
                 self._update_choices(choices)
             return
 
-        # Find the next safe position to cut the text (avoiding breaking markup)
-        next_pos = self.current_typing_position + 1
-        next_text = self.current_typing_content[:next_pos]
-
-        # Check if we're in the middle of a markup tag
-        while next_pos < len(self.current_typing_content):
-            if self._is_safe_markup_position(next_text):
-                break
+        # Find the next safe position to cut the text (avoiding breaking markup),
+        # updating the bracket depth one character at a time rather than
+        # recounting the whole typed prefix
+        next_pos = self.current_typing_position
+        depth = self._bracket_depth
+        while True:
+            char = content[next_pos]
+            if char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
             next_pos += 1
-            next_text = self.current_typing_content[:next_pos]
+            # Check if we're in the middle of a markup tag
+            if next_pos >= content_length or self._is_safe_markup_position(depth, char):
+                break
 
+        self._bracket_depth = depth
         self.current_typing_position = next_pos
+        next_text = content[:next_pos]
 
         # Build the complete text to display (old + partial new)
-        if self.displayed_story_text:
-            display_text = self.displayed_story_text + self.block_separator + next_text
-        else:
-            display_text = next_text
+        display_text = self._display_prefix + next_text
 
         # Update the display
         story_text = self.query_one("#story-text", Static)
         story_text.update(display_text)
 
-        # Schedule next character
-        if self.story_engine.typing_speed > 0:
-            self.set_timer(self.story_engine.typing_speed, self._type_next_character)
+        # Schedule next character, one interval timer ticks for the whole run
+        # instead of a new timer per character
+        typing_speed = self.story_engine.typing_speed
+        if typing_speed > 0:
+            if self._typing_timer is None:
+                self._typing_timer = self.set_interval(
+                    typing_speed, self._type_next_character
+                )
         else:
             # If delay is 0, show all content immediately
-            self.displayed_story_text += (
-                self.block_separator + self.current_typing_content
-                if self.displayed_story_text
-                else self.current_typing_content
-            )
-            story_text.update(self.displayed_story_text)
-            self.pending_new_content.clear()
-            self.is_typing = False
-            choices = self.story_engine.get_available_choices()
-            self._update_choices(choices)
+            self._show_all_pending_content()
+
+    def _show_all_pending_content(self) -> None:
+        """Display every pending block at once, without typing animation."""
+        # One join over all blocks instead of one concatenation per block
+        parts = [self.displayed_story_text] if self.displayed_story_text else []
+        for block_separator, content in self.pending_new_content:
+            if parts:
+                parts.append(block_separator)
+            parts.append(content)
+        self.displayed_story_text = "".join(parts)
+        self.pending_new_content.clear()
+        self.query_one("#story-text", Static).update(self.displayed_story_text)
+        self.is_typing = False
+        self._stop_typing_timer()
+        choices = self.story_engine.get_available_choices()
+        self._update_choices(choices)
+
+    def _stop_typing_timer(self) -> None:
+        """Stop the typing timer once there is nothing left to type."""
+        if self._typing_timer is not None:
+            self._typing_timer.stop()
+            self._typing_timer = None
 
-    def _is_safe_markup_position(self, text: str) -> bool:
-        """Check if the text ends at a safe position that won't break Rich markup."""
-        # Count open and closed brackets
-        open_brackets = text.count("[")
-        close_brackets = text.count("]")
+    @staticmethod
+    def _is_safe_markup_position(bracket_depth: int, last_char: str) -> bool:
+        """Check if the typed text ends at a safe position that won't break Rich markup.
 
+        Args:
+            bracket_depth: Open minus close brackets in the typed text
+            last_char: Last typed character
+        """
         # If we have equal brackets, we're likely safe
-        if open_brackets == close_brackets:
+        # (more close than open means something's wrong, but allow it)
+        if bracket_depth <= 0:
             return True
 
         # If we have more open than close, check if we're at the end of a tag
-        if open_brackets > close_brackets:
-            # Check if the last character is ']' which would close a tag
-            return text.endswith("]")
-
-        # If we have more close than open, something's wrong, but allow it
-        return True
+        return last_char == "]"
 
     def _update_choices(self, choices: List[Node]):
         """Update the choices display."""
         choices_container = self.query_one("#choices", VerticalScroll)
-        choices_container.remove_children()
 
+        widgets: List[Widget] = []
         if choices:
             for choice_node in choices:
                 if choice_node.choice_order is None:
                     raise NotImplementedError("PARSING ERROR")
-                button = ChoiceButton(choice_node, choice_node.choice_order)
-                choices_container.mount(button)
+                widgets.append(ChoiceButton(choice_node, choice_node.choice_order))
         else:
             # Show end message when no choices available
             end_message = Static(
                 "[italic dim]🏁 End of story. Thank you for playing![/italic dim]",
                 classes="end-message",
             )
-            choices_container.mount(end_message)
+            widgets.append(end_message)
+
+        # Swap the whole list in one refresh rather than one per widget
+        with self.batch_update():
+            choices_container.remove_children()
+            choices_container.mount(*widgets)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -0,0 +1,56 @@
+import pytest
+
+from analink.core.models import Node, NodeType
+from analink.core.status import ContainerStateProvider
+
+
+@pytest.fixture(autouse=True)
+def _reset_node_ids():
+    """Start every core test with node ids counting from 1"""
+    Node.reset_id_counter()
+
+
+class _StubProvider(ContainerStateProvider):
+    """Provider returning whatever the test stored on it, cheaper than a Mock"""
+
+    __slots__ = ("container_state", "game_variables", "current_turn", "calls")
+
+    def __init__(self):
+        self.container_state = None
+        self.game_variables = {}
+        self.current_turn = 0
+        self.calls = []
+
+    def get_container_state(self, container_reference):
+        self.calls.append(("state", container_reference))
+        return self.container_state
+
+    def get_game_variables(self):
+        return self.game_variables
+
+    def get_current_turn(self):
+        return self.current_turn
+
+
+@pytest.fixture
+def provider():
+    """Stub provider, fresh for each test"""
+    return _StubProvider()
+
+
+@pytest.fixture(scope="module")
+def make_node():
+    """Node builder, tests only pass the fields that differ from the defaults
+
+    raw_content defaults to the content, or to "" for a node without content.
+    The builder keeps no state, so one is shared by the whole module.
+    """
+
+    def _make_node(**kwargs) -> Node:
+        kwargs.setdefault("node_type", NodeType.BASE)
+        kwargs.setdefault("raw_content", kwargs.get("content") or "")
+        kwargs.setdefault("level", 0)
+        kwargs.setdefault("line_number", 1)
+        return Node(**kwargs)
+
+    return _make_node
@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 import pytest
 from pydantic import ValidationError
 
@@ -7,26 +5,45 @@ from analink.core.condition import (
     BinaryCondition,
     Condition,
     ConditionType,
-    ContainerStateProvider,
     UnaryCondition,
 )
 from analink.core.status import ContainerState, ContainerStatus
 
 
+def _uc(**kwargs) -> UnaryCondition:
+    """Build a condition without validation, for tests that only evaluate it"""
+    return UnaryCondition.model_construct(**kwargs)
+
+
+EXPECTED_CONDITION_TYPE_VALUES = frozenset(
+    {
+        "status_equals",
+        "seen_count_gt",
+        "seen_count_lt",
+        "seen_count_eq",
+        "variable_eq",
+        "variable_gt",
+        "variable_lt",
+        "turn_gt",
+    }
+)
+
+# Expected values shared by the variable tests, do not mutate
+HEALTH_100 = {"variable": "health", "value": 100}
+SCORE_50 = {"variable": "score", "value": 50}
+LIVES_5 = {"variable": "lives", "value": 5}
+
+# Shared by the binary tests, which never modify their operands
+TURN_GT_3 = _uc(condition_type=ConditionType.TURN_GT, expected_value=3)
+TURN_GT_5 = _uc(condition_type=ConditionType.TURN_GT, expected_value=5)
+TURN_GT_15 = _uc(condition_type=ConditionType.TURN_GT, expected_value=15)
+TURN_GT_20 = _uc(condition_type=ConditionType.TURN_GT, expected_value=20)
+
+
 class TestConditionType:
     def test_all_enum_values(self):
-        expected_values = {
-            "status_equals",
-            "seen_count_gt",
-            "seen_count_lt",
-            "seen_count_eq",
-            "variable_eq",
-            "variable_gt",
-            "variable_lt",
-            "turn_gt",
-        }
-        actual_values = {ct.value for ct in ConditionType}
-        assert actual_values == expected_values
+        actual_values = frozenset(ct.value for ct in ConditionType)
+        assert actual_values == EXPECTED_CONDITION_TYPE_VALUES
 
 
 class TestUnaryCondition:
@@ -41,21 +58,23 @@ class TestUnaryCondition:
         assert condition.expected_value == ContainerStatus.ACTIVE
 
     def test_status_equals_invalid_type(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="STATUS_EQUALS requires ContainerStatus"
+        ):
             UnaryCondition(
                 condition_type=ConditionType.STATUS_EQUALS,
                 container_reference="test_container",
                 expected_value="invalid",
             )
-        assert "STATUS_EQUALS requires ContainerStatus" in str(exc_info.value)
 
     def test_status_equals_missing_container_reference(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="STATUS_EQUALS requires container_reference"
+        ):
             UnaryCondition(
                 condition_type=ConditionType.STATUS_EQUALS,
                 expected_value=ContainerStatus.ACTIVE,
             )
-        assert "STATUS_EQUALS requires container_reference" in str(exc_info.value)
 
     def test_seen_count_gt_valid(self):
         condition = UnaryCondition(
@@ -67,27 +86,26 @@ class TestUnaryCondition:
         assert condition.container_reference == "test_container"
 
     def test_seen_count_gt_missing_container_reference(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="seen_count_gt requires container_reference"
+        ):
             UnaryCondition(condition_type=ConditionType.SEEN_COUNT_GT, expected_value=5)
-        assert "seen_count_gt requires container_reference" in str(exc_info.value)
 
     def test_seen_count_gt_negative_invalid(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="requires non-negative integer"):
             UnaryCondition(
                 condition_type=ConditionType.SEEN_COUNT_GT,
                 container_reference="test_container",
                 expected_value=-1,
             )
-        assert "requires non-negative integer" in str(exc_info.value)
 
     def test_seen_count_lt_non_integer_invalid(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="requires non-negative integer"):
             UnaryCondition(
                 condition_type=ConditionType.SEEN_COUNT_LT,
                 container_reference="test_container",
                 expected_value="not_int",
             )
-        assert "requires non-negative integer" in str(exc_info.value)
 
     def test_seen_count_eq_valid(self):
         condition = UnaryCondition(
@@ -111,418 +129,220 @@ class TestUnaryCondition:
         assert condition.expected_value == {"variable": "health", "value": 100}
 
     def test_variable_eq_not_dict(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="requires dict with 'variable' and 'value' keys"
+        ):
             UnaryCondition(
                 condition_type=ConditionType.VARIABLE_EQ, expected_value="not_dict"
             )
-        assert "requires dict with 'variable' and 'value' keys" in str(exc_info.value)
 
     def test_variable_gt_missing_variable_key(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="requires dict with 'variable' and 'value' keys"
+        ):
             UnaryCondition(
                 condition_type=ConditionType.VARIABLE_GT, expected_value={"value": 50}
             )
-        assert "requires dict with 'variable' and 'value' keys" in str(exc_info.value)
 
     def test_variable_lt_missing_value_key(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="requires dict with 'variable' and 'value' keys"
+        ):
             UnaryCondition(
                 condition_type=ConditionType.VARIABLE_LT,
                 expected_value={"variable": "mana"},
             )
-        assert "requires dict with 'variable' and 'value' keys" in str(exc_info.value)
 
     def test_variable_eq_invalid_variable_type(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="requires 'variable' to be string"):
             UnaryCondition(
                 condition_type=ConditionType.VARIABLE_EQ,
                 expected_value={"variable": 123, "value": 50},
             )
-        assert "requires 'variable' to be string" in str(exc_info.value)
 
 
 class TestUnaryConditionEvaluation:
-    def setup_method(self):
-        """Set up mock provider for each test"""
-        self.provider = Mock(spec=ContainerStateProvider)
-
-    def test_status_equals_true(self):
-        condition = UnaryCondition(
+    @pytest.mark.parametrize(
+        "container_state, expected",
+        [
+            (ContainerState(status=ContainerStatus.ACTIVE), True),
+            (ContainerState(status=ContainerStatus.DISABLED), False),
+        ],
+    )
+    def test_status_equals(self, provider, container_state, expected):
+        condition = _uc(
             condition_type=ConditionType.STATUS_EQUALS,
             container_reference="test_container",
             expected_value=ContainerStatus.ACTIVE,
         )
-        container_state = Mock(spec=ContainerState)
-        container_state.status = ContainerStatus.ACTIVE
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is True
-        self.provider.get_container_state.assert_called_once_with("test_container")
-
-    def test_status_equals_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.STATUS_EQUALS,
+        provider.container_state = container_state
+
+        assert condition.evaluate(provider) is expected
+        assert provider.calls == [("state", "test_container")]
+
+    @pytest.mark.parametrize(
+        "condition_type, expected_value, container_state, expected",
+        [
+            (ConditionType.SEEN_COUNT_GT, 5, ContainerState(seen_count=10), True),
+            (ConditionType.SEEN_COUNT_GT, 5, ContainerState(seen_count=3), False),
+            (ConditionType.SEEN_COUNT_LT, 10, ContainerState(seen_count=5), True),
+            (ConditionType.SEEN_COUNT_LT, 10, ContainerState(seen_count=15), False),
+            (ConditionType.SEEN_COUNT_EQ, 7, ContainerState(seen_count=7), True),
+            (ConditionType.SEEN_COUNT_EQ, 7, ContainerState(seen_count=8), False),
+        ],
+    )
+    def test_seen_count(
+        self, provider, condition_type, expected_value, container_state, expected
+    ):
+        condition = _uc(
+            condition_type=condition_type,
             container_reference="test_container",
-            expected_value=ContainerStatus.ACTIVE,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.status = ContainerStatus.DISABLED
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_status_equals_no_container_state(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.STATUS_EQUALS,
+            expected_value=expected_value,
+        )
+        provider.container_state = container_state
+
+        assert condition.evaluate(provider) is expected
+
+    @pytest.mark.parametrize(
+        "condition_type, expected_value",
+        [
+            (ConditionType.STATUS_EQUALS, ContainerStatus.ACTIVE),
+            (ConditionType.SEEN_COUNT_GT, 5),
+            (ConditionType.SEEN_COUNT_LT, 10),
+            (ConditionType.SEEN_COUNT_EQ, 7),
+        ],
+    )
+    def test_no_container_state(self, provider, condition_type, expected_value):
+        condition = _uc(
+            condition_type=condition_type,
             container_reference="missing_container",
-            expected_value=ContainerStatus.ACTIVE,
-        )
-        self.provider.get_container_state.return_value = None
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_gt_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_GT,
-            container_reference="test_container",
-            expected_value=5,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 10
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_seen_count_gt_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_GT,
-            container_reference="test_container",
-            expected_value=5,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 3
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_gt_no_container_state(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_GT,
-            container_reference="missing_container",
-            expected_value=5,
-        )
-        self.provider.get_container_state.return_value = None
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_lt_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_LT,
-            container_reference="test_container",
-            expected_value=10,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 5
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_seen_count_lt_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_LT,
-            container_reference="test_container",
-            expected_value=10,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 15
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_lt_no_container_state(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_LT,
-            container_reference="missing_container",
-            expected_value=10,
-        )
-        self.provider.get_container_state.return_value = None
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_eq_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_EQ,
-            container_reference="test_container",
-            expected_value=7,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 7
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_seen_count_eq_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_EQ,
-            container_reference="test_container",
-            expected_value=7,
-        )
-        container_state = Mock(spec=ContainerState)
-        container_state.seen_count = 8
-        self.provider.get_container_state.return_value = container_state
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_seen_count_eq_no_container_state(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.SEEN_COUNT_EQ,
-            container_reference="missing_container",
-            expected_value=7,
-        )
-        self.provider.get_container_state.return_value = None
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_eq_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_EQ,
-            expected_value={"variable": "health", "value": 100},
-        )
-        self.provider.get_game_variables.return_value = {"health": 100, "mana": 50}
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_variable_eq_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_EQ,
-            expected_value={"variable": "health", "value": 100},
-        )
-        self.provider.get_game_variables.return_value = {"health": 75, "mana": 50}
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_eq_missing_variable(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_EQ,
-            expected_value={"variable": "nonexistent", "value": 100},
-        )
-        self.provider.get_game_variables.return_value = {"health": 75}
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_gt_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_GT,
-            expected_value={"variable": "score", "value": 50},
-        )
-        self.provider.get_game_variables.return_value = {"score": 75}
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_variable_gt_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_GT,
-            expected_value={"variable": "score", "value": 50},
-        )
-        self.provider.get_game_variables.return_value = {"score": 25}
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_gt_missing_variable_defaults_to_zero(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_GT,
-            expected_value={"variable": "nonexistent", "value": 5},
-        )
-        self.provider.get_game_variables.return_value = {"other": 10}
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_lt_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_LT,
-            expected_value={"variable": "lives", "value": 5},
-        )
-        self.provider.get_game_variables.return_value = {"lives": 2}
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_variable_lt_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_LT,
-            expected_value={"variable": "lives", "value": 5},
-        )
-        self.provider.get_game_variables.return_value = {"lives": 8}
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_variable_lt_missing_variable_defaults_to_zero(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.VARIABLE_LT,
-            expected_value={"variable": "nonexistent", "value": 5},
-        )
-        self.provider.get_game_variables.return_value = {"other": 10}
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_turn_gt_true(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=10
-        )
-        self.provider.get_current_turn.return_value = 15
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_turn_gt_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=10
-        )
-        self.provider.get_current_turn.return_value = 5
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_turn_gt_equal_false(self):
-        condition = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=10
-        )
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_unknown_condition_type_returns_false(self):
-        condition = UnaryCondition(
+            expected_value=expected_value,
+        )
+        provider.container_state = None
+
+        assert condition.evaluate(provider) is False
+
+    @pytest.mark.parametrize(
+        "condition_type, expected_value, game_variables, expected",
+        [
+            (ConditionType.VARIABLE_EQ, HEALTH_100, {"health": 100, "mana": 50}, True),
+            (ConditionType.VARIABLE_EQ, HEALTH_100, {"health": 75, "mana": 50}, False),
+            # Missing variable
+            (
+                ConditionType.VARIABLE_EQ,
+                {"variable": "nonexistent", "value": 100},
+                {"health": 75},
+                False,
+            ),
+            (ConditionType.VARIABLE_GT, SCORE_50, {"score": 75}, True),
+            (ConditionType.VARIABLE_GT, SCORE_50, {"score": 25}, False),
+            # Missing variable defaults to zero
+            (
+                ConditionType.VARIABLE_GT,
+                {"variable": "nonexistent", "value": 5},
+                {"other": 10},
+                False,
+            ),
+            (ConditionType.VARIABLE_LT, LIVES_5, {"lives": 2}, True),
+            (ConditionType.VARIABLE_LT, LIVES_5, {"lives": 8}, False),
+            # Missing variable defaults to zero
+            (
+                ConditionType.VARIABLE_LT,
+                {"variable": "nonexistent", "value": 5},
+                {"other": 10},
+                True,
+            ),
+        ],
+    )
+    def test_variable(
+        self, provider, condition_type, expected_value, game_variables, expected
+    ):
+        condition = _uc(condition_type=condition_type, expected_value=expected_value)
+        provider.game_variables = game_variables
+
+        assert condition.evaluate(provider) is expected
+
+    @pytest.mark.parametrize(
+        "current_turn, expected", [(15, True), (5, False), (10, False)]
+    )
+    def test_turn_gt(self, provider, current_turn, expected):
+        condition = _uc(condition_type=ConditionType.TURN_GT, expected_value=10)
+        provider.current_turn = current_turn
+
+        assert condition.evaluate(provider) is expected
+
+    def test_unknown_condition_type_returns_false(self, provider):
+        condition = _uc(
             condition_type=ConditionType.STATUS_EQUALS,
             container_reference="test_container",
             expected_value=ContainerStatus.ACTIVE,
         )
         condition.condition_type = "unknown_type"
 
-        assert condition.evaluate(self.provider) is False
+        assert condition.evaluate(provider) is False
 
 
 class TestBinaryCondition:
-    def setup_method(self):
-        """Set up mock provider for each test"""
-        self.provider = Mock(spec=ContainerStateProvider)
-
-    def test_and_both_true(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=3)
-        condition = BinaryCondition(left=left, operator="AND", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_and_left_false(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=3)
-        condition = BinaryCondition(left=left, operator="AND", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_and_right_false(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        condition = BinaryCondition(left=left, operator="AND", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_and_both_false(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=20)
-        condition = BinaryCondition(left=left, operator="AND", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_or_both_true(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=3)
-        condition = BinaryCondition(left=left, operator="OR", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_or_left_true(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        condition = BinaryCondition(left=left, operator="OR", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_or_right_true(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        condition = BinaryCondition(left=left, operator="OR", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is True
-
-    def test_or_both_false(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=15)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=20)
-        condition = BinaryCondition(left=left, operator="OR", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_invalid_operator(self):
-        left = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=5)
-        right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=3)
-        condition = BinaryCondition(left=left, operator="XOR", right=right)
-        self.provider.get_current_turn.return_value = 10
-
-        assert condition.evaluate(self.provider) is False
-
-    def test_nested_binary_conditions(self):
-        inner_left = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=5
-        )
-        inner_right = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=3
-        )
-        inner_condition = BinaryCondition(
-            left=inner_left, operator="AND", right=inner_right
-        )
-
-        outer_right = UnaryCondition(
-            condition_type=ConditionType.TURN_GT, expected_value=20
-        )
-        outer_condition = BinaryCondition(
-            left=inner_condition, operator="OR", right=outer_right
+    @pytest.mark.parametrize(
+        "left, operator, right, expected",
+        [
+            (TURN_GT_5, "AND", TURN_GT_3, True),
+            (TURN_GT_15, "AND", TURN_GT_3, False),
+            (TURN_GT_5, "AND", TURN_GT_15, False),
+            (TURN_GT_15, "AND", TURN_GT_20, False),
+            (TURN_GT_5, "OR", TURN_GT_3, True),
+            (TURN_GT_5, "OR", TURN_GT_15, True),
+            (TURN_GT_15, "OR", TURN_GT_5, True),
+            (TURN_GT_15, "OR", TURN_GT_20, False),
+            # Unknown operator
+            (TURN_GT_5, "XOR", TURN_GT_3, False),
+        ],
+    )
+    def test_operator(self, provider, left, operator, right, expected):
+        condition = BinaryCondition.model_construct(
+            left=left, operator=operator, right=right
+        )
+        provider.current_turn = 10
+
+        assert condition.evaluate(provider) is expected
+
+    def test_nested_binary_conditions(self, provider):
+        inner_condition = BinaryCondition.model_construct(
+            left=TURN_GT_5, operator="AND", right=TURN_GT_3
+        )
+        outer_condition = BinaryCondition.model_construct(
+            left=inner_condition, operator="OR", right=TURN_GT_20
         )
 
         # Test with turn=10 (inner should be True, outer_right False, so OR = True)
-        self.provider.get_current_turn.return_value = 10
-        assert outer_condition.evaluate(self.provider) is True
+        provider.current_turn = 10
+        assert outer_condition.evaluate(provider) is True
 
         # Test with turn=2 (inner should be False, outer_right False, so OR = False)
-        self.provider.get_current_turn.return_value = 2
-        assert outer_condition.evaluate(self.provider) is False
+        provider.current_turn = 2
+        assert outer_condition.evaluate(provider) is False
 
-    def test_complex_evaluation_with_mixed_conditions(self):
-        container_state = Mock(spec=ContainerState)
-        container_state.status = ContainerStatus.ACTIVE
-        container_state.seen_count = 8
-
-        self.provider.get_container_state.return_value = container_state
-        self.provider.get_game_variables.return_value = {"health": 75, "mana": 30}
-        self.provider.get_current_turn.return_value = 15
+    def test_complex_evaluation_with_mixed_conditions(self, provider):
+        provider.container_state = ContainerState(
+            status=ContainerStatus.ACTIVE, seen_count=8
+        )
+        provider.game_variables = {"health": 75, "mana": 30}
+        provider.current_turn = 15
 
-        left = UnaryCondition(
+        left = _uc(
             condition_type=ConditionType.STATUS_EQUALS,
             container_reference="test_container",
             expected_value=ContainerStatus.ACTIVE,
         )
-        right = UnaryCondition(
+        right = _uc(
             condition_type=ConditionType.VARIABLE_GT,
             expected_value={"variable": "health", "value": 50},
         )
-        condition = BinaryCondition(left=left, operator="AND", right=right)
+        condition = BinaryCondition.model_construct(
+            left=left, operator="AND", right=right
+        )
 
-        result = condition.evaluate(self.provider)
+        result = condition.evaluate(provider)
         assert result is True
 
 
@@ -538,3 +358,62 @@ class TestConditionUnionType:
         right = UnaryCondition(condition_type=ConditionType.TURN_GT, expected_value=3)
         condition: Condition = BinaryCondition(left=left, operator="AND", right=right)
         assert isinstance(condition, BinaryCondition)
+
+    def test_condition_union_dispatches_on_kind(self):
+        condition = BinaryCondition.model_validate(
+            {
+                "left": {
+                    "kind": "unary",
+                    "condition_type": ConditionType.TURN_GT,
+                    "expected_value": 5,
+                },
+                "operator": "OR",
+                "right": {
+                    "kind": "binary",
+                    "left": {
+                        "kind": "unary",
+                        "condition_type": ConditionType.TURN_GT,
+                        "expected_value": 3,
+                    },
+                    "operator": "AND",
+                    "right": {
+                        "kind": "unary",
+                        "condition_type": ConditionType.TURN_GT,
+                        "expected_value": 1,
+                    },
+                },
+            }
+        )
+        assert isinstance(condition.left, UnaryCondition)
+        assert isinstance(condition.right, BinaryCondition)
+        assert isinstance(condition.right.left, UnaryCondition)
+
+    def test_condition_union_infers_untagged_payloads(self):
+        condition = BinaryCondition(
+            left={"condition_type": "turn_gt", "expected_value": 3},
+            operator="AND",
+            right={
+                "left": {"condition_type": "turn_gt", "expected_value": 2},
+                "operator": "OR",
+                "right": {"condition_type": "turn_gt", "expected_value": 1},
+            },
+        )
+        assert isinstance(condition.left, UnaryCondition)
+        assert isinstance(condition.right, BinaryCondition)
+        assert isinstance(condition.right.right, UnaryCondition)
+        assert "kind" not in condition.model_dump()
+        assert BinaryCondition.model_validate(condition.model_dump()) == condition
+
+    def test_condition_union_rejects_unknown_kind(self):
+        with pytest.raises(ValidationError):
+            BinaryCondition.model_validate(
+                {
+                    "left": {"kind": "ternary"},
+                    "operator": "AND",
+                    "right": {
+                        "kind": "unary",
+                        "condition_type": ConditionType.TURN_GT,
+                        "expected_value": 1,
+                    },
+                }
+            )
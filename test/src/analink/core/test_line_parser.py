@@ -1,38 +1,80 @@
-from analink.core.line_parser import InkLineParser, LineMerger
-from analink.core.models import Node, NodeType
+import pytest
+
+from analink.core.condition import ConditionType, UnaryCondition
+from analink.core.line_parser import (
+    InkLineParser,
+    LineMerger,
+    parse_condition_string,
+)
+from analink.core.models import NodeType
+
+
+class TestParseConditionString:
+    """Test the parse_condition_string function"""
+
+    @pytest.mark.parametrize(
+        "condition_str, condition_type, container_reference, expected_value",
+        [
+            ("not visit_paris", ConditionType.SEEN_COUNT_EQ, "visit_paris", 0),
+            ("forest.clearing > 3", ConditionType.SEEN_COUNT_GT, "forest.clearing", 3),
+            ("forest < 2", ConditionType.SEEN_COUNT_LT, "forest", 2),
+            ("visit_paris", ConditionType.SEEN_COUNT_GT, "visit_paris", 0),
+        ],
+    )
+    def test_parse_condition(
+        self, condition_str, condition_type, container_reference, expected_value
+    ):
+        """Test that supported conditions are parsed into valid conditions"""
+        condition = parse_condition_string(condition_str)
+        assert isinstance(condition, UnaryCondition)
+        assert condition.condition_type is condition_type
+        assert condition.container_reference == container_reference
+        assert condition.expected_value == expected_value
+        # Conditions skip validation when parsed, they must still be valid
+        assert UnaryCondition.model_validate(condition.model_dump()) == condition
+
+    @pytest.mark.parametrize("condition_str", ["", "   ", "a == b"])
+    def test_parse_unsupported_condition(self, condition_str):
+        """Test that empty or unsupported conditions return None"""
+        assert parse_condition_string(condition_str) is None
 
 
 class TestInkLineParser:
     """Test the InkLineParser class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
+    @pytest.fixture
+    def parser(self):
+        """Line parser for each test"""
+        return InkLineParser()
 
-    def test_is_comment_or_empty_single_line_comment(self):
+    def test_is_comment_or_empty_single_line_comment(self, parser):
         """Test single line comment detection"""
-        parser = InkLineParser()
         assert parser.is_comment_or_empty("// This is a comment") is True
         assert parser.is_comment_or_empty("  // This is a comment  ") is True
 
-    def test_is_comment_or_empty_multiline_comment(self):
+    def test_is_comment_or_empty_multiline_comment(self, parser):
         """Test multiline comment detection"""
-        parser = InkLineParser()
         assert parser.is_comment_or_empty("/* Start comment") is True
         assert parser.in_comment is True
         assert parser.is_comment_or_empty("Inside comment") is True
         assert parser.is_comment_or_empty("End comment */") is True
         assert parser.in_comment is False
 
-    def test_is_comment_or_empty_regular_text(self):
+    def test_is_comment_or_empty_regular_text(self, parser):
         """Test regular text is not considered comment"""
-        parser = InkLineParser()
         assert parser.is_comment_or_empty("Regular text") is False
         assert parser.is_comment_or_empty("Text with // inside") is False
 
-    def test_parse_divert(self):
+    def test_reset_closes_block_comment(self, parser):
+        """Test that reset lets a parser start a new file outside a comment"""
+        parser.is_comment_or_empty("/* Unclosed comment")
+        assert parser.in_comment is True
+        parser.reset()
+        assert parser.in_comment is False
+        assert parser.is_comment_or_empty("Regular text") is False
+
+    def test_parse_divert(self, parser):
         """Test parsing divert lines"""
-        parser = InkLineParser()
         result = parser.parse_divert("-> END", 5, 10)
         assert result is not None
         assert result.node_type == NodeType.DIVERT
@@ -40,46 +82,40 @@ class TestInkLineParser:
         assert result.level == 5
         assert result.line_number == 10
 
-    def test_parse_divert_with_whitespace(self):
+    def test_parse_divert_with_whitespace(self, parser):
         """Test parsing divert with whitespace"""
-        parser = InkLineParser()
         result = parser.parse_divert("  -> DONE  ", 3, 15)
         assert result is not None
         assert result.name == "DONE"
 
-    def test_parse_divert_non_divert(self):
+    def test_parse_divert_non_divert(self, parser):
         """Test parsing non-divert line returns None"""
-        parser = InkLineParser()
         result = parser.parse_divert("Regular text", 0, 1)
         assert result is None
 
-    def test_parse_knot_or_stitches_knot(self):
+    def test_parse_knot_or_stitches_knot(self, parser):
         """Test parsing knot with double equals"""
-        parser = InkLineParser()
         result = parser.parse_knot_or_stitches("== forest_path ==", 1)
         assert result is not None
         assert result.node_type == NodeType.KNOT
         assert result.name == "forest_path"
         assert result.level == 0
 
-    def test_parse_knot_or_stitches_stitches(self):
+    def test_parse_knot_or_stitches_stitches(self, parser):
         """Test parsing stitches with single equals"""
-        parser = InkLineParser()
         result = parser.parse_knot_or_stitches("= village_entrance", 1)
         assert result is not None
         assert result.node_type == NodeType.STITCHES
         assert result.name == "village_entrance"
         assert result.level == 0
 
-    def test_parse_knot_or_stitches_non_match(self):
+    def test_parse_knot_or_stitches_non_match(self, parser):
         """Test parsing non-knot/stitches line returns None"""
-        parser = InkLineParser()
         result = parser.parse_knot_or_stitches("Regular text", 1)
         assert result is None
 
-    def test_parse_choice_or_gather_choice(self):
+    def test_parse_choice_or_gather_choice(self, parser):
         """Test parsing choice line"""
-        parser = InkLineParser()
         result = parser.parse_choice_or_gather("*** Deep choice", 5)
         assert result is not None
         node, level = result
@@ -88,9 +124,8 @@ class TestInkLineParser:
         assert node.content == "Deep choice"
         assert level == 3
 
-    def test_parse_choice_or_gather_gather(self):
+    def test_parse_choice_or_gather_gather(self, parser):
         """Test parsing gather line"""
-        parser = InkLineParser()
         result = parser.parse_choice_or_gather("-- Gather point", 8)
         assert result is not None
         node, level = result
@@ -99,45 +134,70 @@ class TestInkLineParser:
         assert node.content == "Gather point"
         assert level == 2
 
-    def test_parse_choice_or_gather_non_match(self):
+    def test_parse_choice_or_gather_sticky_choice(self, parser):
+        """Test parsing sticky choice line"""
+        result = parser.parse_choice_or_gather("++ Again", 3)
+        assert result is not None
+        node, level = result
+        assert node.node_type == NodeType.CHOICE
+        assert node.is_sticky is True
+        assert node.content == "Again"
+        assert level == 2
+
+    def test_parse_choice_or_gather_with_condition(self, parser):
+        """Test parsing choice with a condition before or after the marker"""
+        for line in ["* {visit_paris} Go back", "{visit_paris} * Go back"]:
+            result = parser.parse_choice_or_gather(line, 1)
+            assert result is not None
+            node, level = result
+            assert node.node_type == NodeType.CHOICE
+            assert node.is_sticky is False
+            assert node.content == "Go back"
+            assert node.condition is not None
+            assert node.condition.container_reference == "visit_paris"
+            assert level == 1
+
+    def test_parse_choice_or_gather_non_match(self, parser):
         """Test parsing non-choice/gather line returns None"""
-        parser = InkLineParser()
         result = parser.parse_choice_or_gather("Regular text", 1)
         assert result is None
 
-    def test_parse_line_empty(self):
+    def test_parse_line_empty(self, parser):
         """Test parsing empty line returns None"""
-        parser = InkLineParser()
         result = parser.parse_line("", 1, 0)
         assert result == (None, 0)
 
-    def test_parse_line_comment(self):
+    def test_parse_line_comment(self, parser):
         """Test parsing comment line returns None"""
-        parser = InkLineParser()
         result = parser.parse_line("// This is a comment", 1, 0)
         assert result == (None, 0)
 
-    def test_parse_line_divert(self):
+    def test_parse_line_divert(self, parser):
         """Test parsing divert line"""
-        parser = InkLineParser()
         result, level = parser.parse_line("-> END", 1, 2)
         assert result is not None
         assert result.node_type == NodeType.DIVERT
         assert result.name == "END"
         assert level == 2
 
-    def test_parse_line_knot(self):
+    def test_parse_line_gather_is_not_divert(self, parser):
+        """Test that a gather line is not mistaken for a divert"""
+        result, level = parser.parse_line("- - Back -> here", 1, 0)
+        assert result is not None
+        assert result.node_type == NodeType.GATHER
+        assert result.level == 2
+        assert level == 2
+
+    def test_parse_line_knot(self, parser):
         """Test parsing knot line"""
-        parser = InkLineParser()
         result, level = parser.parse_line("== forest ==", 1, 5)
         assert result is not None
         assert result.node_type == NodeType.KNOT
         assert result.name == "forest"
         assert level == 0
 
-    def test_parse_line_choice(self):
+    def test_parse_line_choice(self, parser):
         """Test parsing choice line"""
-        parser = InkLineParser()
         result, level = parser.parse_line("* Choice text", 1, 0)
         assert result is not None
         assert result.node_type == NodeType.CHOICE
@@ -145,9 +205,8 @@ class TestInkLineParser:
         assert result.content == "Choice text"
         assert level == 1
 
-    def test_parse_line_base_content(self):
+    def test_parse_line_base_content(self, parser):
         """Test parsing base content line"""
-        parser = InkLineParser()
         result, level = parser.parse_line("Regular text", 1, 3)
         assert result is not None
         assert result.node_type == NodeType.BASE
@@ -159,116 +218,60 @@ class TestInkLineParser:
 class TestLineMerger:
     """Test the LineMerger class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
-    def test_can_merge_with_previous_base_after_choice(self):
+    def test_can_merge_with_previous_base_after_choice(self, make_node):
         """Test that BASE can merge with previous CHOICE"""
         merger = LineMerger()
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         merger.add_node(choice_node)
 
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Continuation",
-            level=1,
-            line_number=2,
-            content="Continuation",
-        )
+        base_node = make_node(content="Continuation", level=1, line_number=2)
         assert merger.can_merge_with_previous(base_node) is True
 
-    def test_can_merge_with_previous_base_after_gather(self):
+    def test_can_merge_with_previous_base_after_gather(self, make_node):
         """Test that BASE can merge with previous GATHER"""
         merger = LineMerger()
-        gather_node = Node(
-            node_type=NodeType.GATHER,
-            raw_content="- Gather",
-            level=1,
-            line_number=1,
-            content="Gather",
+        gather_node = make_node(
+            node_type=NodeType.GATHER, content="Gather", level=1, raw_content="- Gather"
         )
         merger.add_node(gather_node)
 
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Continuation",
-            level=1,
-            line_number=2,
-            content="Continuation",
-        )
+        base_node = make_node(content="Continuation", level=1, line_number=2)
         assert merger.can_merge_with_previous(base_node) is True
 
-    def test_can_merge_with_previous_base_after_base(self):
+    def test_can_merge_with_previous_base_after_base(self, make_node):
         """Test that BASE can merge with previous BASE"""
         merger = LineMerger()
-        first_base = Node(
-            node_type=NodeType.BASE,
-            raw_content="First",
-            level=0,
-            line_number=1,
-            content="First",
-        )
+        first_base = make_node(content="First")
         merger.add_node(first_base)
 
-        second_base = Node(
-            node_type=NodeType.BASE,
-            raw_content="Second",
-            level=0,
-            line_number=2,
-            content="Second",
-        )
+        second_base = make_node(content="Second", line_number=2)
         assert merger.can_merge_with_previous(second_base) is True
 
-    def test_cannot_merge_non_base_node(self):
+    def test_cannot_merge_non_base_node(self, make_node):
         """Test that non-BASE nodes cannot merge"""
         merger = LineMerger()
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         assert merger.can_merge_with_previous(choice_node) is False
 
-    def test_cannot_merge_without_previous(self):
+    def test_cannot_merge_without_previous(self, make_node):
         """Test that nodes cannot merge without previous node"""
         merger = LineMerger()
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Base",
-            level=0,
-            line_number=1,
-            content="Base",
-        )
+        base_node = make_node(content="Base")
         assert merger.can_merge_with_previous(base_node) is False
 
-    def test_merge_with_previous(self):
+    def test_merge_with_previous(self, make_node):
         """Test merging nodes"""
         merger = LineMerger()
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         merger.add_node(choice_node)
 
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Continuation",
-            level=1,
-            line_number=2,
-            content="Continuation",
-        )
+        base_node = make_node(content="Continuation", level=1, line_number=2)
         merged = merger.merge_with_previous(base_node)
 
         assert merged.node_type == NodeType.CHOICE
@@ -276,15 +279,11 @@ class TestLineMerger:
         assert merged.raw_content == "* Choice\nContinuation"
         assert merged.line_number == 1
 
-    def test_add_node_without_merge(self):
+    def test_add_node_without_merge(self, make_node):
         """Test adding node that doesn't merge"""
         merger = LineMerger()
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         merger.add_node(choice_node)
 
@@ -292,25 +291,15 @@ class TestLineMerger:
         assert len(lines) == 1
         assert choice_node.item_id in lines
 
-    def test_add_node_with_merge(self):
+    def test_add_node_with_merge(self, make_node):
         """Test adding node that merges"""
         merger = LineMerger()
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         merger.add_node(choice_node)
 
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Continuation",
-            level=1,
-            line_number=2,
-            content="Continuation",
-        )
+        base_node = make_node(content="Continuation", level=1, line_number=2)
         merger.add_node(base_node)
 
         lines = merger.get_lines()
@@ -318,27 +307,53 @@ class TestLineMerger:
         merged_node = next(iter(lines.values()))
         assert merged_node.content == "Choice Continuation"
 
-    def test_custom_separator(self):
+    def test_custom_separator(self, make_node):
         """Test custom separator in merging"""
         merger = LineMerger(" | ")
-        choice_node = Node(
-            node_type=NodeType.CHOICE,
-            raw_content="* Choice",
-            level=1,
-            line_number=1,
-            content="Choice",
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
         )
         merger.add_node(choice_node)
 
-        base_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Continuation",
-            level=1,
-            line_number=2,
-            content="Continuation",
-        )
+        base_node = make_node(content="Continuation", level=1, line_number=2)
         merger.add_node(base_node)
 
         lines = merger.get_lines()
         merged_node = next(iter(lines.values()))
         assert merged_node.content == "Choice | Continuation"
+
+    def test_add_node_merges_whole_block(self, make_node):
+        """Test that a run of BASE lines is merged into a single node"""
+        merger = LineMerger()
+        choice_node = make_node(
+            node_type=NodeType.CHOICE, content="Choice", level=1, raw_content="* Choice"
+        )
+        merger.add_node(choice_node)
+        for i, text in enumerate(["First", "Second", "Third"]):
+            merger.add_node(make_node(content=text, level=1, line_number=i + 2))
+
+        lines = merger.get_lines()
+        assert len(lines) == 1
+        merged_node = next(iter(lines.values()))
+        assert merged_node.content == "Choice First Second Third"
+        assert merged_node.raw_content == "* Choice\nFirst\nSecond\nThird"
+        assert merged_node.line_number == 1
+
+    def test_add_node_merges_into_previous_node(self, make_node):
+        """Test that merging grows the previous node instead of replacing it"""
+        merger = LineMerger()
+        choice_node = make_node(
+            node_type=NodeType.CHOICE,
+            content="Choice",
+            level=1,
+            raw_content="+ Choice",
+            is_sticky=True,
+        )
+        merger.add_node(choice_node)
+        merger.add_node(make_node(content="More", level=1, line_number=2))
+
+        lines = merger.get_lines()
+        assert list(lines) == [choice_node.item_id]
+        assert lines[choice_node.item_id] is choice_node
+        assert choice_node.content == "Choice More"
+        assert choice_node.is_sticky is True
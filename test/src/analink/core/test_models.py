@@ -1,5 +1,6 @@
 # test_models.py
 
+import pytest
 
 from analink.core.models import Node, NodeType, RawKnot, RawStory
 
@@ -7,38 +8,43 @@ from analink.core.models import Node, NodeType, RawKnot, RawStory
 class TestNodeType:
     """Test the NodeType enum"""
 
-    def test_node_type_values(self):
+    @pytest.mark.parametrize(
+        "member, value",
+        [
+            ("CHOICE", "choice"),
+            ("GATHER", "gather"),
+            ("BASE", "base_content"),
+            ("KNOT", "knot"),
+            ("STITCHES", "stitches"),
+            ("DIVERT", "divert"),
+            ("END", "end"),
+            ("BEGIN", "begin"),
+            ("AUTO_END", "auto_end"),
+        ],
+    )
+    def test_node_type_values(self, member, value):
         """Test that NodeType enum has correct values"""
-        assert NodeType.CHOICE.value == "choice"
-        assert NodeType.GATHER.value == "gather"
-        assert NodeType.BASE.value == "base_content"
-        assert NodeType.KNOT.value == "knot"
-        assert NodeType.STITCHES.value == "stitches"
-        assert NodeType.DIVERT.value == "divert"
-        assert NodeType.END.value == "end"
-        assert NodeType.BEGIN.value == "begin"
-        assert NodeType.AUTO_END.value == "auto_end"
+        assert NodeType[member].value == value
 
     def test_node_type_members(self):
         """Test that all expected members exist"""
-        assert hasattr(NodeType, "CHOICE")
-        assert hasattr(NodeType, "GATHER")
-        assert hasattr(NodeType, "BASE")
-        assert hasattr(NodeType, "KNOT")
-        assert hasattr(NodeType, "STITCHES")
-        assert hasattr(NodeType, "DIVERT")
-        assert hasattr(NodeType, "END")
-        assert hasattr(NodeType, "BEGIN")
-        assert hasattr(NodeType, "AUTO_END")
+        expected_members = {
+            "CHOICE",
+            "GATHER",
+            "BASE",
+            "KNOT",
+            "STITCHES",
+            "DIVERT",
+            "END",
+            "BEGIN",
+            "AUTO_END",
+        }
+        assert expected_members <= NodeType.__members__.keys()
 
 
 class TestNode:
     """Test the Node class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_node_creation_basic(self):
         """Test basic node creation"""
         node = Node(
@@ -117,9 +123,15 @@ class TestNode:
         node = Node(node_type=NodeType.BASE, raw_content="test", level=0, line_number=1)
         assert node.item_id == 1
 
+    def test_node_has_no_instance_dict(self):
+        """Test that nodes are slotted and reject unknown attributes"""
+        node = Node(node_type=NodeType.BASE, raw_content="test", level=0, line_number=1)
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unknown_field = True  # type: ignore[attr-defined]
+
     def test_get_next_id_class_method(self):
         """Test the _get_next_id class method"""
-        Node.reset_id_counter()
         id1 = Node._get_next_id()
         id2 = Node._get_next_id()
         id3 = Node._get_next_id()
@@ -128,66 +140,60 @@ class TestNode:
         assert id2 == 2
         assert id3 == 3
 
-    def test_end_node_class_method(self):
-        """Test the end_node class method"""
-        node = Node.end_node()
-        assert node.node_type == NodeType.END
+    @pytest.mark.parametrize(
+        "factory, node_type, name",
+        [
+            (Node.end_node, NodeType.END, "END"),
+            (Node.auto_end_node, NodeType.AUTO_END, "AUTO_END"),
+            (Node.begin_node, NodeType.BEGIN, "BEGIN"),
+        ],
+    )
+    def test_sentinel_node_class_methods(self, factory, node_type, name):
+        """Test the end_node, auto_end_node and begin_node class methods"""
+        node = factory()
+        assert node.node_type == node_type
         assert node.raw_content == ""
         assert node.level == -1
         assert node.line_number == -1
-        assert node.name == "END"
+        assert node.name == name
 
-    def test_auto_end_node_class_method(self):
-        """Test the auto_end_node class method"""
-        node = Node.auto_end_node()
-        assert node.node_type == NodeType.AUTO_END
-        assert node.raw_content == ""
-        assert node.level == -1
-        assert node.line_number == -1
-        assert node.name == "AUTO_END"
-
-    def test_begin_node_class_method(self):
-        """Test the begin_node class method"""
-        node = Node.begin_node()
-        assert node.node_type == NodeType.BEGIN
-        assert node.raw_content == ""
-        assert node.level == -1
-        assert node.line_number == -1
-        assert node.name == "BEGIN"
+    def test_sentinel_nodes_are_fresh(self):
+        """Test END/BEGIN/AUTO_END are new instances with fixed ids"""
+        assert Node.end_node() is not Node.end_node()
+        assert Node.end_node().item_id == -1
+        assert Node.begin_node().item_id == -2
+        assert Node.auto_end_node().item_id == -3
 
-    def test_parse_choice_with_brackets(self):
+    def test_parse_choice_with_brackets(self, make_node):
         """Test parse_choice method with bracketed text"""
-        node = Node(
+        node = make_node(
             node_type=NodeType.CHOICE,
             raw_content="* [Open door] You open the heavy door",
             level=1,
-            line_number=1,
             content="[Open door] You open the heavy door",
         )
         result = node.parse_choice()
         assert result.choice_text == "Open door"
         assert result.content == " You open the heavy door"
 
-    def test_parse_choice_without_brackets(self):
+    def test_parse_choice_without_brackets(self, make_node):
         """Test parse_choice method without brackets"""
-        node = Node(
+        node = make_node(
             node_type=NodeType.CHOICE,
             raw_content="* Simple choice",
             level=1,
-            line_number=1,
             content="Simple choice",
         )
         result = node.parse_choice()
         assert result.choice_text == "Simple choice"
         assert result.content == "Simple choice"
 
-    def test_parse_divert_with_arrow(self):
+    def test_parse_divert_with_arrow(self, make_node):
         """Test parse_divert method with arrow"""
-        node = Node(
+        node = make_node(
             node_type=NodeType.CHOICE,
             raw_content="* Go to forest -> forest_path",
             level=1,
-            line_number=1,
             content="Go to forest -> forest_path",
         )
         divert_node = node.parse_divert()
@@ -196,104 +202,62 @@ class TestNode:
         assert divert_node.name == "forest_path"
         assert node.content == "Go to forest"
 
-    def test_parse_divert_without_arrow(self):
+    def test_parse_divert_without_arrow(self, make_node):
         """Test parse_divert method without arrow"""
-        node = Node(
+        node = make_node(
             node_type=NodeType.CHOICE,
             raw_content="* Simple choice",
             level=1,
-            line_number=1,
             content="Simple choice",
         )
         divert_node = node.parse_divert()
         assert divert_node is None
         assert node.content == "Simple choice"
 
-    def test_parse_divert_with_empty_content(self):
+    def test_parse_divert_with_empty_content(self, make_node):
         """Test parse_divert with None content"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Some text",
-            level=0,
-            line_number=1,
-            content=None,
-        )
+        node = make_node(raw_content="Some text", content=None)
         divert_node = node.parse_divert()
         assert divert_node is None
 
-    def test_parse_glue_before(self):
-        """Test parse_glue method with glue before content"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="<>Some text",
-            level=0,
-            line_number=1,
-            content="<>Some text",
-        )
-        node.parse_glue()
-        assert node.glue_before is True
-        assert node.glue_after is False
-        assert node.content == "Some text"
-
-    def test_parse_glue_after(self):
-        """Test parse_glue method with glue after content"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Some text<>",
-            level=0,
-            line_number=1,
-            content="Some text<>",
-        )
+    @pytest.mark.parametrize(
+        "content, glue_before, glue_after, expected_content",
+        [
+            ("<>Some text", True, False, "Some text"),
+            ("Some text<>", False, True, "Some text"),
+            # None content should not raise an error
+            (None, False, False, None),
+        ],
+    )
+    def test_parse_glue(
+        self, make_node, content, glue_before, glue_after, expected_content
+    ):
+        """Test parse_glue method with glue before, after or no content"""
+        node = make_node(raw_content=content or "Some text", content=content)
         node.parse_glue()
-        assert node.glue_before is False
-        assert node.glue_after is True
-        assert node.content == "Some text"
-
-    def test_parse_glue_none_content(self):
-        """Test parse_glue method with None content"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Some text",
-            level=0,
-            line_number=1,
-            content=None,
-        )
-        node.parse_glue()  # Should not raise an error
-        assert node.glue_before is False
-        assert node.glue_after is False
+        assert node.glue_before is glue_before
+        assert node.glue_after is glue_after
+        assert node.content == expected_content
 
-    def test_parse_instruction(self):
+    def test_parse_instruction(self, make_node):
         """Test parse_instruction method"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Some text # CLEAR",
-            level=0,
-            line_number=1,
-            content="Some text # CLEAR",
-        )
+        node = make_node(raw_content="Some text # CLEAR", content="Some text # CLEAR")
         node.parse_instruction()
         assert node.content == "Some text "
         assert node.instruction == " CLEAR"
 
-    def test_parse_instruction_none_content(self):
+    def test_parse_instruction_none_content(self, make_node):
         """Test parse_instruction method with None content"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Some text",
-            level=0,
-            line_number=1,
-            content=None,
-        )
+        node = make_node(raw_content="Some text", content=None)
         node.parse_instruction()  # Should not raise an error
         assert node.instruction is None
 
-    def test_post_process_choice_with_divert(self):
+    def test_post_process_choice_with_divert(self, make_node):
         """Test post_process method with choice that has divert"""
-        node = Node(
+        node = make_node(
             node_type=NodeType.CHOICE,
             raw_content="* [Take sword] You take the sword -> combat",
             level=1,
-            line_number=1,
             content="[Take sword] You take the sword -> combat",
         )
         divert_node = node.post_process()
@@ -307,14 +271,10 @@ class TestNode:
         assert divert_node.node_type == NodeType.DIVERT
         assert divert_node.name == "combat"
 
-    def test_post_process_base_with_glue_and_instruction(self):
+    def test_post_process_base_with_glue_and_instruction(self, make_node):
         """Test post_process method with base content having glue and instruction"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="<>Some text # CLEAR",
-            level=0,
-            line_number=1,
-            content="<>Some text # CLEAR",
+        node = make_node(
+            raw_content="<>Some text # CLEAR", content="<>Some text # CLEAR"
         )
         divert_node = node.post_process()
 
@@ -323,14 +283,10 @@ class TestNode:
         assert node.content == "Some text "
         assert node.instruction == " CLEAR"
 
-    def test_post_process_with_divert_and_glue(self):
+    def test_post_process_with_divert_and_glue(self, make_node):
         """Test post_process method where both main and divert nodes have glue"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="<>Text<> -> <>target<>",
-            level=0,
-            line_number=1,
-            content="<>Text<> -> <>target<>",
+        node = make_node(
+            raw_content="<>Text<> -> <>target<>", content="<>Text<> -> <>target<>"
         )
         divert_node = node.post_process()
 
@@ -347,21 +303,9 @@ class TestNode:
 class TestRawKnot:
     """Test the RawKnot class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
-    def test_raw_knot_creation(self):
+    def test_raw_knot_creation(self, make_node):
         """Test RawKnot creation"""
-        header = {
-            1: Node(
-                node_type=NodeType.BASE,
-                raw_content="Knot header",
-                level=0,
-                line_number=1,
-                content="Knot header",
-            )
-        }
+        header = {1: make_node(raw_content="Knot header", content="Knot header")}
         stitches = {}
         stitches_info = {}
 
@@ -370,50 +314,20 @@ class TestRawKnot:
         assert knot.stitches == stitches
         assert knot.stitches_info == stitches_info
 
-    def test_block_name_to_id_property(self):
+    def test_block_name_to_id_property(self, sample_nodes, sample_knot):
         """Test block_name_to_id property"""
-        Node.reset_id_counter()
-
-        stitches_node = Node(
-            node_type=NodeType.STITCHES,
-            raw_content="= village",
-            level=0,
-            line_number=1,
-            name="village",
-        )
-        content_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Village content",
-            level=0,
-            line_number=2,
-            content="Village content",
-        )
-
-        stitches = {stitches_node.item_id: {content_node.item_id: content_node}}
-        stitches_info = {stitches_node.item_id: stitches_node}
-
-        knot = RawKnot(header={}, stitches=stitches, stitches_info=stitches_info)
-        name_to_id = knot.block_name_to_id
-        assert "village" in name_to_id
-        assert name_to_id["village"] == content_node.item_id
+        name_to_id = sample_knot.block_name_to_id
+        assert "clearing" in name_to_id
+        assert name_to_id["clearing"] == sample_nodes["stitch_content"].item_id
+        assert sample_knot.block_name_to_id is name_to_id  # computed once
 
-    def test_get_blocks(self):
+    def test_get_blocks(self, make_node):
         """Test get_blocks method"""
-        header = {
-            1: Node(
-                node_type=NodeType.BASE,
-                raw_content="Header",
-                level=0,
-                line_number=1,
-                content="Header",
-            )
-        }
+        header = {1: make_node(raw_content="Header", content="Header")}
         stitches = {
             2: {
-                3: Node(
-                    node_type=NodeType.BASE,
+                3: make_node(
                     raw_content="Stitch content",
-                    level=0,
                     line_number=2,
                     content="Stitch content",
                 )
@@ -426,82 +340,56 @@ class TestRawKnot:
         assert blocks[0] == header
         assert blocks[1] == stitches[2]
 
-    def test_first_id_with_header(self):
-        """Test first_id property with header"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Header",
-            level=0,
-            line_number=1,
-            content="Header",
-        )
-        header = {node.item_id: node}
-
-        knot = RawKnot(header=header, stitches={}, stitches_info={})
+    @pytest.mark.parametrize(
+        "first_id_knot", ["with_header", "without_header"], indirect=True
+    )
+    def test_first_id(self, first_id_knot):
+        """Test first_id property with and without header"""
+        knot, node = first_id_knot
         assert knot.first_id == node.item_id
 
-    def test_first_id_without_header(self):
-        """Test first_id property without header"""
-        node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Header",
-            level=0,
-            line_number=1,
-            content="Header",
+    def test_empty_first_stitch_raises_index_error(self, make_node):
+        """Test first_id and block_name_to_id on a knot with an empty stitch"""
+        stitch = make_node(node_type=NodeType.STITCHES, name="s1")
+        knot = RawKnot(
+            header={},
+            stitches={stitch.item_id: {}},
+            stitches_info={stitch.item_id: stitch},
         )
-        stitches = {2: {node.item_id: node}}
+        with pytest.raises(IndexError, match="first stitch is empty"):
+            knot.first_id
+        with pytest.raises(IndexError, match="stitch s1 has no content"):
+            knot.block_name_to_id
 
-        knot = RawKnot(header={}, stitches=stitches, stitches_info={})
-        assert knot.first_id == node.item_id
-
-    def test_get_node(self):
+    def test_get_node(self, sample_nodes, sample_knot):
         """Test get_node method"""
-        Node.reset_id_counter()
+        for role in ["knot_header", "stitch", "stitch_content"]:
+            node = sample_nodes[role]
+            assert sample_knot.get_node(node.item_id) == node
+        assert sample_knot.get_node(999) is None
 
-        header_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Header",
-            level=0,
-            line_number=1,
-            content="Header",
-        )
-        stitches_info_node = Node(
-            node_type=NodeType.STITCHES,
-            raw_content="= stitch",
-            level=0,
-            line_number=2,
-            name="stitch",
+    def test_get_node_prefers_header(self, make_node):
+        """Test get_node looks in the header before the stitches"""
+        header_node = make_node(raw_content="Header")
+        stitch_node = make_node(raw_content="Stitch", line_number=2)
+        knot = RawKnot(
+            header={1: header_node}, stitches={2: {1: stitch_node}}, stitches_info={}
         )
-        stitch_content_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Stitch content",
-            level=0,
-            line_number=3,
-            content="Stitch content",
-        )
-
-        header = {header_node.item_id: header_node}
-        stitches_info = {stitches_info_node.item_id: stitches_info_node}
-        stitches = {
-            stitches_info_node.item_id: {
-                stitch_content_node.item_id: stitch_content_node
-            }
-        }
-
-        knot = RawKnot(header=header, stitches=stitches, stitches_info=stitches_info)
 
-        assert knot.get_node(header_node.item_id) == header_node
-        assert knot.get_node(stitches_info_node.item_id) == stitches_info_node
-        assert knot.get_node(stitch_content_node.item_id) == stitch_content_node
-        assert knot.get_node(999) is None
+        assert knot.get_node(1) is header_node
 
 
 class TestRawStory:
     """Test the RawStory class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
+    def test_raw_story_keeps_given_containers(self):
+        """Test that RawStory stores the given dicts as-is, without copying"""
+        knot = RawKnot(header={}, stitches={}, stitches_info={})
+        knots = {1: knot}
+        story = RawStory(header={}, knots=knots, knots_info={})
+        assert story.knots is knots
+        assert story.knots[1] is knot
+        assert not hasattr(story, "__dict__")
 
     def test_raw_story_creation(self):
         """Test RawStory creation"""
@@ -514,112 +402,104 @@ class TestRawStory:
         assert story.knots == knots
         assert story.knots_info == knots_info
 
-    def test_block_name_to_id_property(self):
+    def test_block_name_to_id_property(self, sample_nodes, sample_story):
         """Test block_name_to_id property with knots and stitches"""
-        Node.reset_id_counter()
+        name_to_id = sample_story.block_name_to_id
 
-        # Create knot info node
-        knot_info_node = Node(
+        assert "forest" in name_to_id
+        assert name_to_id["forest"] == sample_nodes["knot_header"].item_id
+        assert "forest.clearing" in name_to_id
+        assert name_to_id["forest.clearing"] == sample_nodes["stitch_content"].item_id
+        assert sample_story.block_name_to_id is name_to_id  # computed once
+
+    def test_get_node(self, sample_nodes, sample_story):
+        """Test get_node method"""
+        for role in ["header", "knot", "knot_header"]:
+            node = sample_nodes[role]
+            assert sample_story.get_node(node.item_id) == node
+        assert sample_story.get_node(999) is None
+
+
+# Shared story for the tests that only read it, built once per module
+@pytest.fixture(scope="module")
+def sample_nodes():
+    """Nodes of a story with a header and a forest knot holding a clearing stitch"""
+    return {
+        "header": Node(
+            node_type=NodeType.BASE,
+            raw_content="Story header",
+            level=0,
+            line_number=1,
+            content="Story header",
+        ),
+        "knot": Node(
             node_type=NodeType.KNOT,
             raw_content="== forest ==",
             level=0,
-            line_number=1,
+            line_number=2,
             name="forest",
-        )
-
-        # Create knot header content
-        knot_header_node = Node(
+        ),
+        "knot_header": Node(
             node_type=NodeType.BASE,
             raw_content="You enter the forest",
             level=0,
-            line_number=2,
+            line_number=3,
             content="You enter the forest",
-        )
-
-        # Create stitches
-        stitches_info_node = Node(
+        ),
+        "stitch": Node(
             node_type=NodeType.STITCHES,
             raw_content="= clearing",
             level=0,
-            line_number=3,
+            line_number=4,
             name="clearing",
-        )
-
-        stitches_content_node = Node(
+        ),
+        "stitch_content": Node(
             node_type=NodeType.BASE,
             raw_content="A peaceful clearing",
             level=0,
-            line_number=4,
+            line_number=5,
             content="A peaceful clearing",
-        )
-
-        # Build the knot structure
-        knot_header = {knot_header_node.item_id: knot_header_node}
-        stitches = {
-            stitches_info_node.item_id: {
-                stitches_content_node.item_id: stitches_content_node
-            }
-        }
-        stitches_info = {stitches_info_node.item_id: stitches_info_node}
-
-        raw_knot = RawKnot(
-            header=knot_header, stitches=stitches, stitches_info=stitches_info
-        )
-
-        knots = {knot_info_node.item_id: raw_knot}
-        knots_info = {knot_info_node.item_id: knot_info_node}
-
-        story = RawStory(header={}, knots=knots, knots_info=knots_info)
-        name_to_id = story.block_name_to_id
-
-        assert "forest" in name_to_id
-        assert name_to_id["forest"] == knot_header_node.item_id
-        assert "forest.clearing" in name_to_id
-        assert name_to_id["forest.clearing"] == stitches_content_node.item_id
-
-    def test_get_node(self):
-        """Test get_node method"""
-        Node.reset_id_counter()
-
-        # Create header node
-        header_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Story header",
-            level=0,
-            line_number=1,
-            content="Story header",
-        )
-
-        # Create knot info node
-        knot_info_node = Node(
-            node_type=NodeType.KNOT,
-            raw_content="== chapter1 ==",
-            level=0,
-            line_number=2,
-            name="chapter1",
-        )
-
-        # Create knot content
-        knot_content_node = Node(
-            node_type=NodeType.BASE,
-            raw_content="Chapter begins",
-            level=0,
-            line_number=3,
-            content="Chapter begins",
-        )
-
-        header = {header_node.item_id: header_node}
-        knots_info = {knot_info_node.item_id: knot_info_node}
-        raw_knot = RawKnot(
-            header={knot_content_node.item_id: knot_content_node},
-            stitches={},
-            stitches_info={},
-        )
-        knots = {knot_info_node.item_id: raw_knot}
-
-        story = RawStory(header=header, knots=knots, knots_info=knots_info)
-
-        assert story.get_node(header_node.item_id) == header_node
-        assert story.get_node(knot_info_node.item_id) == knot_info_node
-        assert story.get_node(knot_content_node.item_id) == knot_content_node
-        assert story.get_node(999) is None
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_knot(sample_nodes):
+    """The forest knot of the sample story"""
+    knot_header = sample_nodes["knot_header"]
+    stitch = sample_nodes["stitch"]
+    stitch_content = sample_nodes["stitch_content"]
+    return RawKnot(
+        header={knot_header.item_id: knot_header},
+        stitches={stitch.item_id: {stitch_content.item_id: stitch_content}},
+        stitches_info={stitch.item_id: stitch},
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_story(sample_nodes, sample_knot):
+    """Sample story, with its header and the forest knot"""
+    header = sample_nodes["header"]
+    knot = sample_nodes["knot"]
+    return RawStory(
+        header={header.item_id: header},
+        knots={knot.item_id: sample_knot},
+        knots_info={knot.item_id: knot},
+    )
+
+
+@pytest.fixture(scope="module")
+def first_id_knot(request):
+    """Knot whose first node sits in its header or, without header, in a stitch"""
+    node = Node(
+        node_type=NodeType.BASE,
+        raw_content="Header",
+        level=0,
+        line_number=1,
+        content="Header",
+    )
+    if request.param == "with_header":
+        knot = RawKnot(header={node.item_id: node}, stitches={}, stitches_info={})
+    else:
+        knot = RawKnot(header={}, stitches={2: {node.item_id: node}}, stitches_info={})
+    return knot, node
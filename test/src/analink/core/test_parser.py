@@ -1,5 +1,7 @@
 # test_node.py
 
+import os
+
 import pytest
 
 from analink.core.models import Node, NodeType, RawStory
@@ -7,16 +9,13 @@ from analink.core.parser import (
     InkParser,
     RawStoryBuilder,
     clean_lines,
+    read_include_lines,
 )
 
 
 class TestRawStoryBuilder:
     """Test the RawStoryBuilder class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_process_knot_node(self):
         """Test processing a knot node"""
         builder = RawStoryBuilder()
@@ -206,10 +205,6 @@ class TestRawStoryBuilder:
 class TestInkParser:
     """Test the InkParser class"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_handle_include_files_no_includes(self):
         """Test handling lines with no includes"""
         parser = InkParser()
@@ -217,6 +212,34 @@ class TestInkParser:
         result = parser.handle_include_files(lines.copy())
         assert result == lines
 
+    def test_handle_include_files_consecutive_includes(self, tmp_path):
+        """Test that every INCLUDE is expanded, nested ones included"""
+        (tmp_path / "a.ink").write_text("A line\nINCLUDE c.ink")
+        (tmp_path / "b.ink").write_text("B line")
+        (tmp_path / "c.ink").write_text("C line")
+        parser = InkParser()
+        lines = ["INCLUDE a.ink", "INCLUDE b.ink", "Main line"]
+        result = parser.handle_include_files(lines, tmp_path)
+        assert result == ["Main line", "A line", "B line", "C line"]
+
+    def test_read_include_lines_rereads_modified_file(self, tmp_path):
+        """Test that included lines are cached until the file changes"""
+        include = tmp_path / "a.ink"
+        include.write_text("First\nSecond\n")
+        assert read_include_lines(include) == ("First", "Second")
+        assert read_include_lines(include) is read_include_lines(include)
+
+        include.write_text("Changed")
+        stat = include.stat()
+        os.utime(include, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert read_include_lines(include) == ("Changed",)
+
+    def test_read_include_lines_splits_on_newlines_only(self, tmp_path):
+        """Test that included lines keep form feeds and line separators"""
+        include = tmp_path / "a.ink"
+        include.write_text("Hello\u2028world\x0c!\nNext", encoding="utf-8")
+        assert read_include_lines(include) == ("Hello\u2028world\x0c!", "Next")
+
     def test_parse_simple_ink(self):
         """Test parsing simple ink code"""
         parser = InkParser()
@@ -228,6 +251,15 @@ class TestInkParser:
         node = next(iter(story.header.values()))
         assert node.content == "Hello world"
 
+    def test_parse_splits_on_newlines_only(self):
+        """Test that form feeds and Unicode line separators stay in the line"""
+        parser = InkParser()
+        story = parser.parse("Hello\u2028world\x0c!")
+
+        assert len(story.header) == 1
+        node = next(iter(story.header.values()))
+        assert node.content == "Hello\u2028world\x0c!"
+
     def test_parse_with_choices(self):
         """Test parsing ink with choices"""
         parser = InkParser()
@@ -267,10 +299,6 @@ Second line"""
 class TestCleanLines:
     """Test the clean_lines function"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_empty_input(self):
         """Test with empty input"""
         result = clean_lines("")
@@ -343,6 +371,23 @@ class TestCleanLines:
         assert choice_node.content == "Go to forest"
         assert divert_node.name == "forest_path"
 
+    def test_choice_with_divert_in_stitch(self):
+        """Test the divert of a choice lands in the same stitch as the choice"""
+        ink_code = """== forest ==
+Trees.
+= clearing
+* Go back -> village"""
+        result = clean_lines(ink_code)
+
+        knot = next(iter(result.knots.values()))
+        assert [n.content for n in knot.header.values()] == ["Trees."]
+        stitch_nodes = list(next(iter(knot.stitches.values())).values())
+        assert [n.node_type for n in stitch_nodes] == [
+            NodeType.CHOICE,
+            NodeType.DIVERT,
+        ]
+        assert stitch_nodes[1].name == "village"
+
     def test_knot_structure(self):
         """Test parsing with knots"""
         ink_code = """Opening text
@@ -553,10 +598,6 @@ Sub content"""
 class TestIntegration:
     """Integration tests to ensure all components work together"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_full_ink_parsing_workflow(self):
         """Test a complete Ink parsing workflow"""
         ink_code = """You wake up in a dark room.
@@ -762,10 +803,6 @@ Final content in main story."""
 class TestParserIntegration:
     """Test integration between parser components"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_post_processing_integration(self):
         """Test that post-processing is properly integrated"""
         ink_code = "* [Choose option] <> You chose wisely. # CLEAR -> next_section"
@@ -970,10 +1007,6 @@ Final base line"""
 class TestParserErrorHandling:
     """Test error handling and edge cases"""
 
-    def setup_method(self):
-        """Reset ID counter before each test"""
-        Node.reset_id_counter()
-
     def test_malformed_knot_headers(self):
         """Test handling of malformed knot headers"""
         ink_code = """== incomplete_knot
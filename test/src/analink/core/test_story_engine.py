@@ -2,6 +2,7 @@
 Unit tests for the story engine module.
 """
 
+import os
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
@@ -186,7 +187,6 @@ Line three.
             line_number=999,
             content="Fake choice",
             choice_text="Fake choice",
-            item_id=9999,
         )
 
         result = engine.make_choice(fake_choice)
@@ -579,6 +579,46 @@ Line three.
         assert len(content_calls) > 0
         assert len(choice_calls) > 0
 
+    def test_same_story_reuses_parse_without_sharing_state(self, simple_story):
+        """Test that engines built from the same text do not share mutable state."""
+        first = StoryEngine(simple_story)
+        next_id = Node._get_next_id()
+        first.start_story()
+        first.make_choice(first.get_available_choices()[0])
+
+        second = StoryEngine(simple_story)
+        assert second.nodes.keys() == first.nodes.keys()
+        assert all(second.nodes[i] is not first.nodes[i] for i in first.nodes)
+        assert second.edges is not first.edges
+        assert all(node.choice_order is None for node in second.nodes.values())
+        assert Node._get_next_id() == next_id
+
+    def test_same_story_gets_its_own_raw_story(self, simple_story):
+        """Test that engines built from the same text get separate raw stories."""
+        first = StoryEngine(simple_story)
+        second = StoryEngine(simple_story)
+        assert second.raw_story is not first.raw_story
+        for item_id, node in second.raw_story.header.items():
+            assert node is second.nodes[item_id]
+            assert node is not first.raw_story.header[item_id]
+
+    def test_story_with_include_rereads_modified_file(self, tmp_path):
+        """Test that a modified included file is picked up by the next engine."""
+        included = tmp_path / "a.ink"
+        included.write_text("Hello from A")
+        story = "Main\nINCLUDE a.ink"
+        first = StoryEngine(story, cwd=tmp_path)
+
+        included.write_text("Hello again")
+        stat = included.stat()
+        os.utime(included, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = StoryEngine(story, cwd=tmp_path)
+
+        first_contents = [node.content for node in first.nodes.values()]
+        second_contents = [node.content for node in second.nodes.values()]
+        assert "Main Hello from A" in first_contents
+        assert "Main Hello again" in second_contents
+
     def test_edge_case_empty_nodes(self):
         """Test edge case with empty nodes dictionary."""
         engine = StoryEngine("")
@@ -1,12 +1,13 @@
 import pytest
 
-from analink.core.parser import Node, NodeType, RawKnot, RawStory
+from analink.core.parser import Node, NodeType, RawKnot, RawStory, clean_lines
 from analink.parser.graph_story import (
     KEY_KNOT_NAME,
     escape_mermaid_text,
     excel_column_number_to_name,
     find_leaves_from_node,
     graph_to_mermaid,
+    mermaid_node_label,
     parse_base_block,
     parse_knot,
     parse_story,
@@ -128,6 +129,18 @@ class TestEscapeMermaidText:
         assert escape_mermaid_text(text) == text
 
 
+class TestMermaidNodeLabel:
+    """Test the mermaid_node_label function"""
+
+    def test_quotes_and_newlines(self):
+        """Test double quotes become single and newlines become spaces"""
+        assert mermaid_node_label('He said "hi"\nthen left') == "He said 'hi' then left"
+
+    def test_empty_content(self):
+        """Test empty content gets the default label"""
+        assert mermaid_node_label("") == "DEFAULT"
+
+
 class TestParseBaseBlock:
     """Test the parse_base_block function"""
 
@@ -368,6 +381,33 @@ class TestParseBaseBlock:
         # Should connect base to END (-1)
         assert (base_node.item_id, KEY_KNOT_NAME["END"]) in result
 
+    def test_divert_local_block_shadows_global_block(self):
+        """Test that a local block wins over a global block with the same name"""
+        base_node = Node(
+            node_type=NodeType.BASE,
+            raw_content="Base",
+            level=0,
+            line_number=1,
+            content="Base",
+        )
+        divert_node = Node(
+            node_type=NodeType.DIVERT,
+            raw_content="-> target",
+            level=0,
+            line_number=2,
+            name="target",
+        )
+
+        nodes = {
+            base_node.item_id: base_node,
+            divert_node.item_id: divert_node,
+        }
+
+        result = parse_base_block(nodes, {"target": 42}, {"target": 999})
+
+        assert (base_node.item_id, 42) in result
+        assert (base_node.item_id, 999) not in result
+
     def test_divert_at_start_level_zero(self):
         """Test divert at level 0 without previous nodes"""
         divert_node = Node(
@@ -553,6 +593,12 @@ class TestParseStory:
         assert nodes[-2].node_type == NodeType.BEGIN
         assert nodes[-3].node_type == NodeType.AUTO_END
 
+    def test_knot_with_empty_stitch_raises_index_error(self):
+        """Test an empty first stitch fails with IndexError, not StopIteration"""
+        raw_story = clean_lines("== k1 ==\n= s1\n== k2 ==\nHi")
+        with pytest.raises(IndexError):
+            parse_story(raw_story)
+
     def test_story_with_header_only(self):
         """Test story with only header content"""
         header_node = Node(
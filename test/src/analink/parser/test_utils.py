@@ -55,6 +55,17 @@ class TestExtractParts:
             _ = extract_parts(text)
         assert "2 occurrences" in str(exc_info)
 
+    def test_extract_many_brackets_reports_total(self):
+        """Test that the error counts every bracket pair, not just two"""
+        with pytest.raises(ValueError, match="3 occurrences"):
+            extract_parts("[a] [b] [c]")
+
+    def test_extract_nested_opening_bracket(self):
+        """Test that a "[" inside the pair splits at the innermost one"""
+        version1, version2 = extract_parts("Go [on [now] quickly")
+        assert version1 == "Go [on now"
+        assert version2 == "Go [on  quickly"
+
     def test_extract_multiline_text(self):
         """Test brackets in multiline text"""
         text = "Line one\n[Select] this option\nLine three"
@@ -153,3 +164,15 @@ class TestCountLeadingChars:
         count, text = count_leading_chars("   ", "*")
         assert count == 0
         assert text == ""
+
+    def test_interleaved_whitespace(self):
+        """Test leading characters separated by whitespace are all counted"""
+        count, text = count_leading_chars("\t* * \t'A wager!'", "*")
+        assert count == 2
+        assert text == "'A wager!'"
+
+    def test_other_char_not_counted(self):
+        """Test that only the requested character is counted"""
+        count, text = count_leading_chars("- * text", "*")
+        assert count == 0
+        assert text == "- * text"
@@ -33,73 +33,73 @@ from analink.parser.graph_story import graph_to_mermaid, parse_story
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                4: {
+                2: {
                     "text": "B C",
                     "level": 1,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "B C",
                 },
-                7: {
+                4: {
                     "text": "AA BB",
                     "level": 2,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "AA BB",
                 },
-                8: {
+                6: {
                     "text": "AAA",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "AAA",
                 },
-                9: {
+                7: {
                     "text": "BBB",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "BBB",
                 },
-                10: {
+                8: {
                     "text": "CCC",
                     "level": 3,
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                13: {
+                9: {
                     "text": "DDD EEE",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "DDD EEE",
                 },
-                14: {
+                11: {
                     "text": "FFF",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "FFF",
                 },
-                15: {
+                12: {
                     "text": "GGG",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "GGG",
                 },
-                16: {
+                13: {
                     "text": "CC",
                     "level": 2,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "CC",
                 },
-                17: {
+                14: {
                     "text": "DD",
                     "level": 2,
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                18: {
+                15: {
                     "text": "C",
                     "level": 1,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "C",
                 },
-                19: {
+                16: {
                     "text": "D",
                     "level": 1,
                     "node_type": NodeType.GATHER,
@@ -109,35 +109,35 @@ from analink.parser.graph_story import graph_to_mermaid, parse_story
             """```mermaid
 flowchart TD
     1["A"]
-    4{"B C"}
-    7{"AA BB"}
-    8{"AAA"}
-    9{"BBB"}
-    10["CCC"]
-    13{"DDD EEE"}
-    14{"FFF"}
-    15{"GGG"}
-    16{"CC"}
-    17["DD"]
-    18{"C"}
-    19["D"]
-    1 -->|B C| 4
-    4 -->|AA BB| 7
-    7 -->|AAA| 8
-    7 -->|BBB| 9
-    8 --> 10
-    9 --> 10
-    10 -->|DDD EEE| 13
-    10 -->|FFF| 14
-    10 -->|GGG| 15
-    4 -->|CC| 16
-    13 --> 17
-    14 --> 17
-    15 --> 17
-    16 --> 17
-    1 -->|C| 18
-    17 --> 19
-    18 --> 19
+    2{"B C"}
+    4{"AA BB"}
+    6{"AAA"}
+    7{"BBB"}
+    8["CCC"]
+    9{"DDD EEE"}
+    11{"FFF"}
+    12{"GGG"}
+    13{"CC"}
+    14["DD"]
+    15{"C"}
+    16["D"]
+    1 -->|B C| 2
+    2 -->|AA BB| 4
+    4 -->|AAA| 6
+    4 -->|BBB| 7
+    6 --> 8
+    7 --> 8
+    8 -->|DDD EEE| 9
+    8 -->|FFF| 11
+    8 -->|GGG| 12
+    2 -->|CC| 13
+    9 --> 14
+    11 --> 14
+    12 --> 14
+    13 --> 14
+    1 -->|C| 15
+    14 --> 16
+    15 --> 16
 ```""",
         ],
         [
@@ -166,73 +166,73 @@ flowchart TD
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                4: {
+                2: {
                     "text": "B C",
                     "level": 1,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "B K",
                 },
-                7: {
+                4: {
                     "text": "AA BB",
                     "level": 2,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "AA BB",
                 },
-                8: {
+                6: {
                     "text": "AAA",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "AAU",
                 },
-                9: {
+                7: {
                     "text": "BBB",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "BBB",
                 },
-                10: {
+                8: {
                     "text": "CCC",
                     "level": 3,
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                13: {
+                9: {
                     "text": "DDD EEE",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "DDD EEE",
                 },
-                14: {
+                11: {
                     "text": "FFF",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "FFF",
                 },
-                15: {
+                12: {
                     "text": "GGG",
                     "level": 3,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "GGG",
                 },
-                16: {
+                13: {
                     "text": "CC",
                     "level": 2,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "CC",
                 },
-                17: {
+                14: {
                     "text": "DD",
                     "level": 2,
                     "node_type": NodeType.GATHER,
                     "choice_text": None,
                 },
-                18: {
+                15: {
                     "text": "C",
                     "level": 1,
                     "node_type": NodeType.CHOICE,
                     "choice_text": "C",
                 },
-                19: {
+                16: {
                     "text": "D",
                     "level": 1,
                     "node_type": NodeType.GATHER,
@@ -242,35 +242,35 @@ flowchart TD
             """```mermaid
 flowchart TD
     1["A"]
-    4{"B C"}
-    7{"AA BB"}
-    8{"AAA"}
-    9{"BBB"}
-    10["CCC"]
-    13{"DDD EEE"}
-    14{"FFF"}
-    15{"GGG"}
-    16{"CC"}
-    17["DD"]
-    18{"C"}
-    19["D"]
-    1 -->|B K| 4
-    4 -->|AA BB| 7
-    7 -->|AAU| 8
-    7 -->|BBB| 9
-    8 --> 10
-    9 --> 10
-    10 -->|DDD EEE| 13
-    10 -->|FFF| 14
-    10 -->|GGG| 15
-    4 -->|CC| 16
-    13 --> 17
-    14 --> 17
-    15 --> 17
-    16 --> 17
-    1 -->|C| 18
-    17 --> 19
-    18 --> 19
+    2{"B C"}
+    4{"AA BB"}
+    6{"AAA"}
+    7{"BBB"}
+    8["CCC"]
+    9{"DDD EEE"}
+    11{"FFF"}
+    12{"GGG"}
+    13{"CC"}
+    14["DD"]
+    15{"C"}
+    16["D"]
+    1 -->|B K| 2
+    2 -->|AA BB| 4
+    4 -->|AAU| 6
+    4 -->|BBB| 7
+    6 --> 8
+    7 --> 8
+    8 -->|DDD EEE| 9
+    8 -->|FFF| 11
+    8 -->|GGG| 12
+    2 -->|CC| 13
+    9 --> 14
+    11 --> 14
+    12 --> 14
+    13 --> 14
+    1 -->|C| 15
+    14 --> 16
+    15 --> 16
 ```""",
         ],
     ],